@@ -43,6 +43,48 @@ _HOT_STANDBY_RE = re.compile(r"\b(HSBY|HOT\s*STANDBY|HOTSTANDBY)\b", re.IGNORECA
 _AVAILABILITY_PATTERN_RE = re.compile(r"(\d+)/(\d+)/(\d+)")
 _CREW_COMPOSITION_RE = re.compile(r"^[A-Z]{2,}\s+\d{1,4}\s+(\d+)/(\d+)/(\d+)/?", re.MULTILINE)
 
+# Header fields on the first pages of a bid roster
+_HEADER_BID_PERIOD_RE = re.compile(r"Bid\s+Period\s*:?\s*(\d{4})", re.IGNORECASE)
+_HEADER_DATE_RANGE_RE = re.compile(
+    r"Bid\s+Period\s+Date\s+Range\s*:?\s*(\d{2}[A-Za-z]{3}\d{4}\s*-\s*\d{2}[A-Za-z]{3}\d{4})",
+    re.IGNORECASE,
+)
+_HEADER_DOMICILE_RE = re.compile(r"Domicile\s*:?\s*([A-Z]{3})", re.IGNORECASE)
+_HEADER_FLEET_RE = re.compile(r"Fleet\s+Type\s*:?\s*([\w\-]+)", re.IGNORECASE)
+_HEADER_DATE_TIME_RE = re.compile(
+    r"Date/Time\s*:?\s*(\d{2}[A-Za-z]{3}\d{4}\s+\d{1,2}:\d{2})", re.IGNORECASE
+)
+
+# Reserve metrics: CT/BT of zero ("0:00" or "0.00") and DD of 14
+_CT_ZERO_RE = re.compile(r"CT\s*:?\s*0+[:\.]0+", re.IGNORECASE)
+_BT_ZERO_RE = re.compile(r"BT\s*:?\s*0+[:\.]0+", re.IGNORECASE)
+_DD_FOURTEEN_RE = re.compile(r"DD\s*:?\s*14\b", re.IGNORECASE)
+
+# Line block fields, keyed by label
+_TIME_FIELD_RES = {
+    label: re.compile(rf"{label}\s*:?\s*([0-9]{{1,3}}:[0-9]{{2}})") for label in ("CT", "BT")
+}
+_INT_FIELD_RES = {label: re.compile(rf"{label}\s*:?\s*(\d{{1,2}})") for label in ("DO", "DD")}
+
+# Fallbacks for CT/BT labels garbled by PDF extraction (e.g. "CHTA:N 81:12", "CT:F 8R2A:45")
+_CT_FLEXIBLE_RE = re.compile(
+    r"[A-Z\s]*C[A-Z\s]*T[A-Z]*\s*:[A-Z\s]*\s*([0-9]+:[0-9]{2})", re.IGNORECASE
+)
+_CT_CORRUPTED_RE = re.compile(
+    r"[A-Z\s]*C[A-Z\s]*T[A-Z]*\s*:[A-Z\s]*\s*([0-9A-Z]+:[0-9]{2})", re.IGNORECASE
+)
+_BT_FLEXIBLE_RE = re.compile(
+    r"[A-Z\s]*B[A-Z\s]*T[A-Z]*\s*:[A-Z\s]*\s*([0-9]+:[0-9]{2})", re.IGNORECASE
+)
+_BT_CORRUPTED_RE = re.compile(r"[A-Z\s]*B[A-Z\s]*T[A-Z]*\s*:\s*([0-9A-Z]+:[0-9]{2})", re.IGNORECASE)
+_TIME_VALUE_RE = re.compile(r"^[0-9]{1,3}:[0-9]{2}$")
+_NON_TIME_CHARS_RE = re.compile(r"[^0-9:]")
+
+# Cell and line cleanup
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
+_NON_DIGIT_RE = re.compile(r"[^\d]")
+_NON_NUMERIC_RE = re.compile(r"[^\d\.]+")
+
 
 @dataclass
 class ParseDiagnostics:
@@ -92,37 +134,31 @@ def extract_bid_line_header_info(pdf_file: IO[bytes]) -> Dict[str, Any]:
 
         # Extract Bid Period (e.g., "Bid Period : 2507")
         if extracted["bid_period"] is None:
-            bid_period_match = re.search(r"Bid\s+Period\s*:?\s*(\d{4})", text, re.IGNORECASE)
+            bid_period_match = _HEADER_BID_PERIOD_RE.search(text)
             if bid_period_match:
                 extracted["bid_period"] = bid_period_match.group(1)
 
         # Extract Bid Period Date Range (e.g., "Bid Period Date Range: 02Nov2025 - 30Nov2025")
         if extracted["bid_period_date_range"] is None:
-            date_range_match = re.search(
-                r"Bid\s+Period\s+Date\s+Range\s*:?\s*(\d{2}[A-Za-z]{3}\d{4}\s*-\s*\d{2}[A-Za-z]{3}\d{4})",
-                text,
-                re.IGNORECASE,
-            )
+            date_range_match = _HEADER_DATE_RANGE_RE.search(text)
             if date_range_match:
                 extracted["bid_period_date_range"] = date_range_match.group(1)
 
         # Extract Domicile (e.g., "Domicile: ONT")
         if extracted["domicile"] is None:
-            domicile_match = re.search(r"Domicile\s*:?\s*([A-Z]{3})", text, re.IGNORECASE)
+            domicile_match = _HEADER_DOMICILE_RE.search(text)
             if domicile_match:
                 extracted["domicile"] = domicile_match.group(1).upper()
 
         # Extract Fleet Type (e.g., "Fleet Type: 757")
         if extracted["fleet_type"] is None:
-            fleet_match = re.search(r"Fleet\s+Type\s*:?\s*([\w\-]+)", text, re.IGNORECASE)
+            fleet_match = _HEADER_FLEET_RE.search(text)
             if fleet_match:
                 extracted["fleet_type"] = fleet_match.group(1)
 
         # Extract Date/Time (e.g., "Date/Time: 26Sep2025 11:35")
         if extracted["date_time"] is None:
-            datetime_match = re.search(
-                r"Date/Time\s*:?\s*(\d{2}[A-Za-z]{3}\d{4}\s+\d{1,2}:\d{2})", text, re.IGNORECASE
-            )
+            datetime_match = _HEADER_DATE_TIME_RE.search(text)
             if datetime_match:
                 extracted["date_time"] = datetime_match.group(1)
 
@@ -277,9 +313,9 @@ def _detect_reserve_line(block: str) -> Tuple[bool, bool, int, int]:
 
     # Check for CT:0.00 BT:0.00 pattern (DD:14 might be missing)
     # Allow both "0:00" and "0.00" formats
-    ct_zero = re.search(r"CT\s*:?\s*0+[:\.]0+", block, re.IGNORECASE)
-    bt_zero = re.search(r"BT\s*:?\s*0+[:\.]0+", block, re.IGNORECASE)
-    dd_fourteen = re.search(r"DD\s*:?\s*14\b", block, re.IGNORECASE)
+    ct_zero = _CT_ZERO_RE.search(block)
+    bt_zero = _BT_ZERO_RE.search(block)
+    dd_fourteen = _DD_FOURTEEN_RE.search(block)
 
     # Reserve if CT=0 AND BT=0 (with or without DD:14)
     has_zero_credit_block = bool(ct_zero and bt_zero)
@@ -621,8 +657,7 @@ def _parse_block_text(block: str, page_number: int) -> Tuple[List[dict], List[st
 
 def _extract_time_field(block: str, label: str) -> Optional[float]:
     # First try exact match
-    pattern = re.compile(rf"{label}\s*:?\s*([0-9]{{1,3}}:[0-9]{{2}})")
-    match = pattern.search(block)
+    match = _TIME_FIELD_RES[label].search(block)
     if match:
         return _time_to_hours(match.group(1))
 
@@ -633,57 +668,44 @@ def _extract_time_field(block: str, label: str) -> Optional[float]:
         # Try to find a time value near any C*T* pattern
         # Look for patterns like: CT:F 82:45, CHTA:N 81:12, CT:N 83:02, CT:F 8R2A:45
         # Pattern allows for letters/spaces between CT and colon, and after colon
-        flexible_pattern = re.compile(
-            r"[A-Z\s]*C[A-Z\s]*T[A-Z]*\s*:[A-Z\s]*\s*([0-9]+:[0-9]{2})", re.IGNORECASE
-        )
-        match = flexible_pattern.search(block)
+        match = _CT_FLEXIBLE_RE.search(block)
         if match:
             time_str = match.group(1)
             # Validate it's a proper time format
-            if re.match(r"^[0-9]{1,3}:[0-9]{2}$", time_str):
+            if _TIME_VALUE_RE.match(time_str):
                 return _time_to_hours(time_str)
 
         # Also try matching heavily corrupted formats like "8R2A:45" where digits are mixed with letters
         # Look for C*T* followed by colon, then any mix of letters/digits, then colon and 2 digits
-        corrupted_pattern = re.compile(
-            r"[A-Z\s]*C[A-Z\s]*T[A-Z]*\s*:[A-Z\s]*\s*([0-9A-Z]+:[0-9]{2})", re.IGNORECASE
-        )
-        match = corrupted_pattern.search(block)
+        match = _CT_CORRUPTED_RE.search(block)
         if match:
             time_str = match.group(1)
             # Clean out letters, keeping only digits and colon
-            cleaned = re.sub(r"[^0-9:]", "", time_str)
-            if re.match(r"^[0-9]{1,3}:[0-9]{2}$", cleaned):
+            cleaned = _NON_TIME_CHARS_RE.sub("", time_str)
+            if _TIME_VALUE_RE.match(cleaned):
                 return _time_to_hours(cleaned)
 
     elif label == "BT":
         # Similar pattern for BT
-        flexible_pattern = re.compile(
-            r"[A-Z\s]*B[A-Z\s]*T[A-Z]*\s*:[A-Z\s]*\s*([0-9]+:[0-9]{2})", re.IGNORECASE
-        )
-        match = flexible_pattern.search(block)
+        match = _BT_FLEXIBLE_RE.search(block)
         if match:
             time_str = match.group(1)
-            if re.match(r"^[0-9]{1,3}:[0-9]{2}$", time_str):
+            if _TIME_VALUE_RE.match(time_str):
                 return _time_to_hours(time_str)
 
         # Corrupted BT patterns
-        corrupted_pattern = re.compile(
-            r"[A-Z\s]*B[A-Z\s]*T[A-Z]*\s*:\s*([0-9A-Z]+:[0-9]{2})", re.IGNORECASE
-        )
-        match = corrupted_pattern.search(block)
+        match = _BT_CORRUPTED_RE.search(block)
         if match:
             time_str = match.group(1)
-            cleaned = re.sub(r"[^0-9:]", "", time_str)
-            if re.match(r"^[0-9]{1,3}:[0-9]{2}$", cleaned):
+            cleaned = _NON_TIME_CHARS_RE.sub("", time_str)
+            if _TIME_VALUE_RE.match(cleaned):
                 return _time_to_hours(cleaned)
 
     return None
 
 
 def _extract_int_field(block: str, label: str) -> Optional[int]:
-    pattern = re.compile(rf"{label}\s*:?\s*(\d{{1,2}})")
-    match = pattern.search(block)
+    match = _INT_FIELD_RES[label].search(block)
     if not match:
         return None
     try:
@@ -831,7 +853,7 @@ def _normalized_candidates(lines: Iterable[str]) -> Iterable[str]:
         if not stripped or stripped.lower().startswith("line "):
             continue
 
-        normalized = re.sub(r"\s+", " ", stripped)
+        normalized = _WHITESPACE_RUN_RE.sub(" ", stripped)
         if buffer:
             combined = f"{buffer} {normalized}".strip()
             if LINE_RE.search(combined):
@@ -869,7 +891,7 @@ def _parse_lines_from_table(table: Sequence[Sequence[Optional[str]]]) -> List[di
     for row in table:
         if not row:
             continue
-        cells = [re.sub(r"\s+", " ", cell).strip() for cell in row if cell]
+        cells = [_WHITESPACE_RUN_RE.sub(" ", cell).strip() for cell in row if cell]
         if not cells or cells[0].lower().startswith("line"):
             continue
         if len(cells) < 5:
@@ -886,7 +908,7 @@ def _parse_lines_from_table(table: Sequence[Sequence[Optional[str]]]) -> List[di
 
 def _cells_to_record(cells: Sequence[str]) -> Optional[dict]:
     try:
-        line_id = int(re.sub(r"[^\d]", "", cells[0]))
+        line_id = int(_NON_DIGIT_RE.sub("", cells[0]))
         ct_val = float(_normalize_numeric(cells[1]))
         bt_val = float(_normalize_numeric(cells[2]))
         do_val = int(_normalize_numeric(cells[3], allow_float=False))
@@ -906,7 +928,7 @@ def _cells_to_record(cells: Sequence[str]) -> Optional[dict]:
 
 def _normalize_numeric(value: str, allow_float: bool = True) -> str:
     cleaned = value.replace("O", "0").replace("o", "0")
-    cleaned = re.sub(r"[^\d\.]+", "", cleaned)
+    cleaned = _NON_NUMERIC_RE.sub("", cleaned)
     if not allow_float:
         cleaned = cleaned.split(".")[0]
     return cleaned
@@ -21,6 +21,7 @@ from .parser import (
     clean_text,
     extract_pdf_header_info,
     format_trip_details,
+    parse_pairings,
     parse_trip_for_table,
 )
 
@@ -32,6 +33,7 @@ __all__ = [
     "run_edw_report",
     # Parser utilities
     "extract_pdf_header_info",
+    "parse_pairings",
     "parse_trip_for_table",
     "format_trip_details",
     "clean_text",
@@ -15,7 +15,10 @@ from config import (
     HOT_STANDBY_MAX_SEGMENTS,
 )
 
-from .parser import extract_local_times
+from .parser import iter_local_times
+
+# Airport pair route segments like "ONT-SDF" or "ONT-ONT"
+_AIRPORT_PAIR_RE = re.compile(r"\b([A-Z]{3})-([A-Z]{3})\b")
 
 
 def is_edw_trip(trip_text):
@@ -36,9 +39,7 @@ def is_edw_trip(trip_text):
         - Includes: 02:30, 03:00, 04:00, 05:00
         - Excludes: 02:29, 05:01
     """
-    times = extract_local_times(trip_text)
-    for t in times:
-        hh, mm = map(int, t.split(":"))
+    for hh, mm in iter_local_times(trip_text):
         # Check if time falls within EDW range using config constants
         if (
             (hh == EDW_START_HOUR and mm >= EDW_START_MINUTE)
@@ -72,8 +73,7 @@ def is_hot_standby(trip_text):
     """
     # Look for airport pair patterns like "ONT-ONT", "SDF-SDF", etc.
     # Format is typically: FLIGHT_NUMBER\nDEPT-ARVL
-    pattern = re.compile(r"\b([A-Z]{3})-([A-Z]{3})\b")
-    matches = pattern.findall(trip_text)
+    matches = _AIRPORT_PAIR_RE.findall(trip_text)
 
     # Only mark as Hot Standby if:
     # 1. Exactly one route segment found (using config constant)
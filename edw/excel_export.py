@@ -80,28 +80,30 @@ def build_edw_dataframes(df_trips):
     duty_dist["Percent"] = (duty_dist["Trips"] / duty_dist["Trips"].sum() * 100).round(1)
 
     # Summaries - account for frequency
+    # Work on the column arrays rather than building a masked copy of df_trips
+    # for each weighted sum below
+    frequencies = df_trips["Frequency"].to_numpy()
+    edw_mask = df_trips["EDW"].to_numpy(dtype=bool)
+    hot_standby_mask = df_trips["Hot Standby"].to_numpy(dtype=bool)
+
     unique_pairings = len(df_trips)
-    total_trips = df_trips["Frequency"].sum()  # Total number of actual trips
-    edw_trips = df_trips[df_trips["EDW"]]["Frequency"].sum()  # EDW trips weighted by frequency
-    hot_standby_pairings = len(df_trips[df_trips["Hot Standby"]])  # Unique hot standby pairings
-    hot_standby_trips = df_trips[df_trips["Hot Standby"]][
-        "Frequency"
-    ].sum()  # Hot standby occurrences
+    total_trips = frequencies.sum()  # Total number of actual trips
+    edw_trips = frequencies[edw_mask].sum()  # EDW trips weighted by frequency
+    hot_standby_pairings = int(hot_standby_mask.sum())  # Unique hot standby pairings
+    hot_standby_trips = frequencies[hot_standby_mask].sum()  # Hot standby occurrences
 
     trip_weighted = edw_trips / total_trips * 100 if total_trips else 0
 
     # TAFB weighted - multiply TAFB by frequency
-    tafb_total = (df_trips["TAFB Hours"] * df_trips["Frequency"]).sum()
-    tafb_edw = (
-        df_trips[df_trips["EDW"]]["TAFB Hours"] * df_trips[df_trips["EDW"]]["Frequency"]
-    ).sum()
+    tafb_weights = df_trips["TAFB Hours"].to_numpy() * frequencies
+    tafb_total = tafb_weights.sum()
+    tafb_edw = tafb_weights[edw_mask].sum()
     tafb_weighted = (tafb_edw / tafb_total * 100) if tafb_total > 0 else 0
 
     # Duty day weighted - multiply duty days by frequency
-    dutyday_total = (df_trips["Duty Days"] * df_trips["Frequency"]).sum()
-    dutyday_edw = (
-        df_trips[df_trips["EDW"]]["Duty Days"] * df_trips[df_trips["EDW"]]["Frequency"]
-    ).sum()
+    dutyday_weights = df_trips["Duty Days"].to_numpy() * frequencies
+    dutyday_total = dutyday_weights.sum()
+    dutyday_edw = dutyday_weights[edw_mask].sum()
     dutyday_weighted = (dutyday_edw / dutyday_total * 100) if dutyday_total > 0 else 0
 
     # Duty Day Statistics - calculate from duty_day_details (excluding Hot Standby)
@@ -110,10 +112,9 @@ def build_edw_dataframes(df_trips):
     non_edw_duty_days = []
 
     # Filter out Hot Standby trips to be consistent with distribution charts
-    for _, row in df_trips[~df_trips["Hot Standby"]].iterrows():
-        duty_day_details = row["Duty Day Details"]
-        frequency = row["Frequency"]
-
+    for duty_day_details, frequency in zip(
+        df_regular_trips["Duty Day Details"], df_regular_trips["Frequency"]
+    ):
         # Each duty day detail appears 'frequency' times
         for duty_day in duty_day_details:
             for _ in range(frequency):
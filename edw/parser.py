@@ -5,12 +5,153 @@ This module contains all functions related to reading and parsing pairing PDFs,
 extracting trip data, duty day information, and other metrics.
 """
 
+import multiprocessing
+import os
 import re
 import unicodedata
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+import pymupdf  # Much faster text extraction for header pages
 from PyPDF2 import PdfReader
 
+# -------------------------------------------------------------------
+# Page Extraction
+# -------------------------------------------------------------------
+# Worker processes are opt-in: set EDW_PARSE_WORKERS to the number of processes
+# the host may use (unset or 1 keeps extraction and analysis serial)
+_WORKERS_ENV_VAR = "EDW_PARSE_WORKERS"
+# Pages are extracted in worker processes only for PDFs at least this long;
+# for shorter files process start-up costs more than it saves
+_PARALLEL_MIN_PAGES = 40
+_MAX_EXTRACT_WORKERS = 8
+# Pages extracted per PdfReader in the serial path; PyPDF2 keeps every parsed
+# page alive for the reader's lifetime
+_EXTRACT_CHUNK_PAGES = 25
+
+# -------------------------------------------------------------------
+# Compiled Patterns
+# -------------------------------------------------------------------
+# Compiled once at import time - these run per line inside the trip parsers,
+# so going through re's module-level pattern cache on every call adds up.
+
+# PDF header fields, e.g. "Bid Period : 2601", "Domicile: ONT", "Fleet Type: 757",
+# "Bid Period Date Range: 30Nov2025 - 25Jan2026", "Date/Time: 16Oct2025 16:32".
+# Each alternative consumes only its label and captures the value in a lookahead,
+# so a value never hides a label that follows it on the same line.
+_HEADER_FIELDS_RE = re.compile(
+    r"Bid\s+Period\s*:\s*(?=(?P<bid_period>\d+))"
+    r"|Domicile\s*:\s*(?=(?P<domicile>[A-Z]{3}))"
+    r"|Fleet\s+Type\s*:\s*(?=(?P<fleet_type>[A-Z0-9\-]+))"
+    r"|Bid\s+Period\s+Date\s+Range\s*:\s*(?=(?P<date_range>.+?)(?:\n|Date/Time))"
+    r"|Date/Time\s*:\s*(?=(?P<report_date>.+?)(?:\n|$))",
+    re.IGNORECASE,
+)
+
+# Pairing PDF structure
+# Applied to whole page texts with "\n" line breaks; [^\S\n] keeps each match
+# within a single line
+_OPEN_TRIPS_REPORT_RE = re.compile(r"Open[^\S\n]+Trips?[^\S\n]+Report", re.IGNORECASE)
+_TRIP_ID_LINE_RE = re.compile(r"^[^\S\n]*Trip[^\S\n]*Id", re.IGNORECASE | re.MULTILINE)
+_DATE_FREQUENCY_RE = re.compile(r"\d+\s+trips?\)", re.IGNORECASE)
+_DATE_ONLY_ON_RE = re.compile(r"Only on|^\d{2}\w{3}\d{4}", re.IGNORECASE)
+
+# Times and durations. These only match ASCII digits and punctuation, so re.ASCII
+# lets the engine test \d with a plain range check instead of a Unicode lookup.
+_LOCAL_TIME_RE = re.compile(r"\((\d{1,2})\)(\d{2}):(\d{2})", re.ASCII)  # (HH)MM:SS
+_PAREN_TIME_RE = re.compile(r"\((\d+)\)(\d{2}:\d{2})", re.ASCII)  # (HH)HH:MM
+_HOURS_MINUTES_RE = re.compile(r"(\d+)h(\d+)", re.ASCII)
+_DURATION_RE = re.compile(r"(\d+h\d+)", re.ASCII)
+# Integer values of the 1-2 digit groups captured by _LOCAL_TIME_RE ("7", "07",
+# "59"): a dict lookup is cheaper than int() for these tiny strings
+_TWO_DIGIT_INTS = {**{str(i): i for i in range(10)}, **{f"{i:02d}": i for i in range(100)}}
+
+# Trip-level metrics in a single pass (see parse_trip_metrics): TAFB, Trip Id,
+# "Duty XhYY" and "(N trips)". TAFB is matched case-sensitively, the rest ignore case.
+_TRIP_METRICS_RE = re.compile(
+    r"(?-i:TAFB:\s*(?P<tafb_h>\d+)h(?P<tafb_m>\d+))"
+    r"|Trip\s*Id:\s*(?P<trip_id>\d+)"
+    r"|Duty\s+(?P<duty_h>\d+)h(?P<duty_m>\d+)"
+    r"|\((?P<frequency>\d+)\s+trips?\)",
+    re.IGNORECASE,
+)
+
+# Trip summary values ("Credit Time: 10h00", "Premium 1.5", "per Diem: 63.0", ...)
+_CREDIT_TIME_RE = re.compile(r"Credit Time:\s*(\S+)")
+_BLOCK_TIME_RE = re.compile(r"Block Time:\s*(\S+)")
+_DUTY_TIME_RE = re.compile(r"Duty Time:\s*(\S+)")
+_TAFB_VALUE_RE = re.compile(r"TAFB:\s*(\S+)")
+_PREMIUM_RE = re.compile(r"Premium:?\s*(\S+)")
+_PER_DIEM_RE = re.compile(r"per\s+Diem:?\s*(\S+)", re.IGNORECASE)
+_LDGS_RE = re.compile(r"LDGS\s+(\d+)")
+_DOMICILE_RE = re.compile(r"Domicile:\s*(\S+)")
+_CREW_RE = re.compile(r"Crew:\s*(\S+)")
+# Every trip summary label in one pass; labels never overlap, so finditer sees them all
+_TRIP_SUMMARY_LABEL_RE = re.compile(
+    r"(?P<credit>Credit Time:)|(?P<block>Block Time:)|(?P<duty>Duty Time:)|(?P<tafb>TAFB:)"
+    r"|(?P<premium>Premium)|(?P<per_diem>(?i:per\s+Diem))|(?P<ldgs>LDGS)"
+    r"|(?P<domicile>Domicile:)|(?P<crew>Crew:)"
+)
+_TRIP_SUMMARY_KEYS = {
+    "credit": "Credit",
+    "block": "Blk",
+    "duty": "Duty Time",
+    "tafb": "TAFB",
+    "premium": "Prem",
+    "per_diem": "PDiem",
+    "ldgs": "LDGS",
+    "domicile": "Domicile",
+    "crew": "Crew",
+}
+
+# parse_trip_for_table keys -> format_trip_details keys
+_LEGACY_FLIGHT_KEYS = {
+    "flight": "flight",
+    "route": "route",
+    "depart": "start",
+    "arrive": "end",
+    "block": "block",
+    "connection": "connection",
+}
+_LEGACY_SUMMARY_KEYS = {
+    "TAFB": "TAFB",
+    "Credit": "Credit Time",
+    "Blk": "Block Time",
+    "Duty Time": "Duty Time",
+    "Prem": "Premium",
+    "PDiem": "Per Diem",
+    "LDGS": "Landings",
+}
+
+# clean_text substitutions: non-breaking space -> space, bullets/squares -> "-"
+_CLEAN_TEXT_TABLE = {0x00A0: " ", **dict.fromkeys(map(ord, "■•▪●"), "-")}
+
+# Duty day markers
+_BRIEFING_RE = re.compile(r"\bBriefing\b", re.IGNORECASE)
+_DEBRIEFING_RE = re.compile(r"\bDebriefing\b", re.IGNORECASE)
+# Suffix shared by both markers: one case-insensitive scan finds the few lines
+# that can hold either
+_BRIEFING_SUFFIX_RE = re.compile(r"briefing\b", re.IGNORECASE)
+_TIME_LABEL_RE = re.compile(r"^\s*(Duty|Block|Credit)\s*$", re.IGNORECASE)
+_INLINE_TIME_RE = re.compile(r"\b(Duty|Block|Credit)\s+(\d+)h(\d+)")
+_TIME_LABEL_FIELDS = {"duty": "duration_hours", "block": "block_hours", "credit": "credit_hours"}
+_INLINE_DUTY_TIME_RE = re.compile(r"\bDuty\s+(\d+h\d+)")
+_INLINE_BLOCK_TIME_RE = re.compile(r"\bBlock\s+(\d+h\d+)")
+_INLINE_CREDIT_VALUE_RE = re.compile(r"\bCredit\s+(\S+)")
+
+# Flight legs
+_DAY_PREFIX_RE = re.compile(r"^\d+\s+\(")
+_DAY_RE = re.compile(r"^(\d+\s+\([^)]*\)\S*)")
+_CARRIER_RE = re.compile(r"(UPS|DH|GT)", re.IGNORECASE)
+_LEG_LINE_RE = re.compile(
+    r"^(?:(?P<flight>(?:UPS|DH|GT)(?:\s|\d|N/A))|(?P<bare>\d{3,4})$)", re.IGNORECASE
+)
+_FLIGHT_NUMBER_RE = re.compile(r"((?:UPS|GT|DH)\s*\S+)", re.IGNORECASE)
+_ROUTE_RE = re.compile(r"([A-Z]{3}-[A-Z]{3})")
+_ROUTE_LINE_RE = re.compile(r"^([A-Z]{3}-[A-Z]{3})(\([A-Z]\))?$")
+
 
 # -------------------------------------------------------------------
 # Text Sanitizer
@@ -27,10 +168,7 @@ def clean_text(text: str) -> str:
     """
     if not isinstance(text, str):
         return text
-    text = unicodedata.normalize("NFKC", text)
-    text = text.replace("\u00a0", " ")
-    text = re.sub(r"[■•▪●]", "-", text)
-    return text
+    return unicodedata.normalize("NFKC", text).translate(_CLEAN_TEXT_TABLE)
 
 
 # -------------------------------------------------------------------
@@ -54,16 +192,6 @@ def extract_pdf_header_info(pdf_path: Path):
             'report_date': str
         }
     """
-    reader = PdfReader(str(pdf_path))
-    if len(reader.pages) == 0:
-        return {
-            "bid_period": "Unknown",
-            "domicile": "Unknown",
-            "fleet_type": "Unknown",
-            "date_range": "Unknown",
-            "report_date": "Unknown",
-        }
-
     # Initialize results
     result = {
         "bid_period": "Unknown",
@@ -77,42 +205,24 @@ def extract_pdf_header_info(pdf_path: Path):
     def extract_from_text(text, current_result):
         extracted = current_result.copy()
 
-        # Extract Bid Period (e.g., "Bid Period : 2601")
-        if extracted["bid_period"] == "Unknown":
-            bid_period_match = re.search(r"Bid\s+Period\s*:\s*(\d+)", text, re.IGNORECASE)
-            if bid_period_match:
-                extracted["bid_period"] = bid_period_match.group(1)
-
-        # Extract Domicile (e.g., "Domicile: ONT")
-        if extracted["domicile"] == "Unknown":
-            domicile_match = re.search(r"Domicile\s*:\s*([A-Z]{3})", text, re.IGNORECASE)
-            if domicile_match:
-                extracted["domicile"] = domicile_match.group(1)
-
-        # Extract Fleet Type (e.g., "Fleet Type: 757")
-        if extracted["fleet_type"] == "Unknown":
-            fleet_match = re.search(r"Fleet\s+Type\s*:\s*([A-Z0-9\-]+)", text, re.IGNORECASE)
-            if fleet_match:
-                extracted["fleet_type"] = fleet_match.group(1)
-
-        # Extract Bid Period Date Range (e.g., "Bid Period Date Range: 30Nov2025 - 25Jan2026")
-        if extracted["date_range"] == "Unknown":
-            date_range_match = re.search(
-                r"Bid\s+Period\s+Date\s+Range\s*:\s*(.+?)(?:\n|Date/Time)", text, re.IGNORECASE
-            )
-            if date_range_match:
-                extracted["date_range"] = date_range_match.group(1).strip()
+        missing = {key for key, value in extracted.items() if value == "Unknown"}
 
-        # Extract Date/Time (e.g., "Date/Time: 16Oct2025 16:32")
-        if extracted["report_date"] == "Unknown":
-            report_date_match = re.search(r"Date/Time\s*:\s*(.+?)(?:\n|$)", text, re.IGNORECASE)
-            if report_date_match:
-                extracted["report_date"] = report_date_match.group(1).strip()
+        for match in _HEADER_FIELDS_RE.finditer(text):
+            if not missing:
+                break
+            key = match.lastgroup
+            if key in missing:
+                extracted[key] = match.group(key).strip()
+                missing.discard(key)
 
         return extracted
 
+    page_texts = _iter_header_page_texts(pdf_path)
+
     # Try extracting from first page
-    first_page_text = reader.pages[0].extract_text()
+    first_page_text = next(page_texts, None)
+    if first_page_text is None:
+        return result
     result = extract_from_text(first_page_text, result)
 
     # If any critical fields are still Unknown, try second page
@@ -120,13 +230,48 @@ def extract_pdf_header_info(pdf_path: Path):
         result["bid_period"] == "Unknown"
         or result["domicile"] == "Unknown"
         or result["fleet_type"] == "Unknown"
-    ) and len(reader.pages) >= 2:
-        second_page_text = reader.pages[1].extract_text()
-        result = extract_from_text(second_page_text, result)
+    ):
+        second_page_text = next(page_texts, None)
+        if second_page_text is not None:
+            result = extract_from_text(second_page_text, result)
 
     return result
 
 
+def _iter_header_page_texts(pdf_path: Path, max_pages: int = 2):
+    """
+    Lazily yield the text of the first pages of a PDF for header extraction.
+
+    Uses PyMuPDF (roughly an order of magnitude faster than PyPDF2) and falls
+    back to PyPDF2 if it cannot open the file. The header regexes are whitespace-tolerant, so both backends produce
+    the same header fields.
+
+    Note: parse_pairings() intentionally stays on PyPDF2 - the trip parser relies
+    on its one-text-run-per-line layout, which PyMuPDF does not reproduce.
+
+    Args:
+        pdf_path: Path to the PDF file
+        max_pages: Maximum number of pages to read
+
+    Yields:
+        Page text strings, in page order
+    """
+    try:
+        doc = pymupdf.open(str(pdf_path))
+    except Exception:
+        doc = None  # Fall back to PyPDF2 below
+
+    if doc is not None:
+        with doc:
+            for page_index in range(min(max_pages, doc.page_count)):
+                yield doc.load_page(page_index).get_text("text")
+        return
+
+    reader = PdfReader(str(pdf_path))
+    for page in reader.pages[:max_pages]:
+        yield page.extract_text()
+
+
 # -------------------------------------------------------------------
 # PDF Parsing
 # -------------------------------------------------------------------
@@ -145,48 +290,188 @@ def parse_pairings(pdf_path: Path, progress_callback=None):
         List of trip text strings (only assigned pairings, not open time)
     """
     reader = PdfReader(str(pdf_path))
-    all_text = ""
-    total_pages = len(reader.pages)
-
-    for i, page in enumerate(reader.pages, start=1):
-        all_text += page.extract_text() + "\n"
-        # Update progress during PDF parsing (0-40% of total progress)
-        if progress_callback and i % 10 == 0:  # Update every 10 pages
-            progress = int(5 + (i / total_pages) * 35)  # 5% to 40%
-            progress_callback(progress, f"Parsing PDF... ({i}/{total_pages} pages)")
 
     trips = []
-    current_trip = []
-    in_trip = False  # Flag to track if we've started collecting trips
+    current_trip = None  # Page segments of the trip being collected
 
-    for line in all_text.splitlines():
+    # Pages are streamed one at a time, so pages after "Open Trips Report"
+    # are never extracted
+    for page_text in _iter_pdf_page_texts(pdf_path, reader, progress_callback):
         # Stop parsing when we hit "Open Trips Report" section
         # This section contains duplicate trips in open time that we don't need
-        if re.search(r"Open\s+Trips?\s+Report", line, re.IGNORECASE):
+        report_match = _OPEN_TRIPS_REPORT_RE.search(page_text)
+        if report_match:
+            # Keep only the lines before the one containing the marker
+            report_line_start = page_text.rfind("\n", 0, report_match.start()) + 1
+            page_text = page_text[: report_line_start - 1] if report_line_start else None
+
+        if page_text is not None:
+            # Each trip runs from its Trip Id line up to the next Trip Id line
+            trip_starts = [m.start() for m in _TRIP_ID_LINE_RE.finditer(page_text)]
+            trip_ends = trip_starts[1:] + [len(page_text) + 1]
+
+            # Lines before the first Trip Id line continue the previous page's trip
+            head_end = trip_starts[0] if trip_starts else len(page_text) + 1
+            if current_trip is not None and head_end > 0:
+                current_trip.append(page_text[: head_end - 1])
+
+            for start, end in zip(trip_starts, trip_ends):
+                if current_trip is not None:
+                    trips.append("\n".join(current_trip))
+                current_trip = [page_text[start : end - 1]]
+
+        if report_match:
             # Save the current trip if we have one
-            if current_trip and in_trip:
+            if current_trip is not None:
                 trips.append("\n".join(current_trip))
             if progress_callback:
                 progress_callback(
                     45, f"Stopped at 'Open Trips Report' - found {len(trips)} pairings"
                 )
             break  # Stop parsing - we've reached open time duplicates
-
-        if re.match(r"^\s*Trip\s*Id", line, re.IGNORECASE):
-            if current_trip:
-                trips.append("\n".join(current_trip))
-            current_trip = [line]  # Start new trip with the Trip Id line
-            in_trip = True
-        elif in_trip:
-            current_trip.append(line)
     else:
         # Loop completed without break - add final trip if we have one
-        if current_trip and in_trip:
+        if current_trip is not None:
             trips.append("\n".join(current_trip))
 
     return trips
 
 
+def _pool_workers(limit: int) -> int:
+    """
+    Number of worker processes to use for parsing, or 1 to stay serial.
+
+    Parallel parsing is opt-in via EDW_PARSE_WORKERS: os.cpu_count() reports
+    the host's cores, not a container's CPU or memory quota. The requested
+    count is still capped by the CPUs this process may run on and by limit.
+
+    Args:
+        limit: Maximum useful number of workers for the caller
+
+    Returns:
+        Worker count, at least 1
+    """
+    try:
+        requested = int(os.environ.get(_WORKERS_ENV_VAR, "1"))
+    except ValueError:
+        return 1
+
+    if hasattr(os, "sched_getaffinity"):
+        available = len(os.sched_getaffinity(0))
+    else:  # pragma: no cover - macOS / Windows
+        available = os.cpu_count() or 1
+
+    return max(1, min(requested, available, limit))
+
+
+def _process_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Create a process pool that never fork()s the calling process.
+
+    Streamlit runs scripts in a multi-threaded server, where forking can
+    deadlock on locks held by other threads; spawned workers start fresh and
+    import only the worker function's module.
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def _iter_pdf_page_texts(pdf_path: Path, reader, progress_callback=None):
+    """
+    Yield the text of every page in a PDF, one page at a time.
+
+    Line breaks are normalized to newlines and each page ends on a complete line,
+    so joining the pages with newlines gives the document's lines in order.
+    When worker processes are enabled (EDW_PARSE_WORKERS), large PDFs are
+    extracted in parallel (PyPDF2 is pure Python, so threads would serialize
+    on the GIL); pages are still yielded in document order. Otherwise pages are read serially in chunks, each
+    with its own short-lived reader, to bound memory on long PDFs.
+
+    Args:
+        pdf_path: Path to the PDF file
+        reader: PdfReader already opened on pdf_path
+        progress_callback: Optional callback function(progress, message) for progress updates
+
+    Yields:
+        Page text strings in document order (each representing at least one line)
+    """
+    total_pages = len(reader.pages)
+    workers = _pool_workers(_MAX_EXTRACT_WORKERS)
+
+    if workers > 1 and total_pages >= _PARALLEL_MIN_PAGES:
+        page_texts = _iter_page_texts_parallel(pdf_path, total_pages, workers)
+    else:
+        page_texts = _iter_page_texts_chunked(pdf_path, total_pages)
+
+    for i, page_text in enumerate(page_texts, start=1):
+        yield "\n".join((page_text + "\n").splitlines())
+        # Update progress during PDF parsing (0-40% of total progress)
+        if progress_callback and i % 10 == 0:  # Update every 10 pages
+            progress = int(5 + (i / total_pages) * 35)  # 5% to 40%
+            progress_callback(progress, f"Parsing PDF... ({i}/{total_pages} pages)")
+
+
+def _iter_page_texts_chunked(pdf_path: Path, total_pages: int):
+    """
+    Extract page texts serially, opening a fresh reader every few pages.
+
+    PyPDF2 keeps each parsed page and its decoded content streams alive for
+    the lifetime of the reader; a short-lived reader per chunk lets earlier
+    chunks be freed while later pages are extracted.
+
+    Args:
+        pdf_path: Path to the PDF file
+        total_pages: Number of pages in the PDF
+
+    Yields:
+        Extracted text of each page, in order
+    """
+    for start in range(0, total_pages, _EXTRACT_CHUNK_PAGES):
+        chunk_reader = PdfReader(str(pdf_path))
+        for i in range(start, min(start + _EXTRACT_CHUNK_PAGES, total_pages)):
+            yield chunk_reader.pages[i].extract_text()
+
+
+def _iter_page_texts_parallel(pdf_path: Path, total_pages: int, workers: int):
+    """
+    Extract page texts in a process pool, yielding them in page order.
+
+    Pages are split into contiguous chunks so each worker opens the PDF once
+    per chunk. Chunks not yet started are cancelled if the consumer stops
+    early (e.g. at "Open Trips Report").
+
+    Args:
+        pdf_path: Path to the PDF file
+        total_pages: Number of pages in the PDF
+        workers: Number of worker processes
+
+    Yields:
+        Extracted text of each page, in order
+    """
+    chunk_size = max(1, -(-total_pages // (workers * 4)))
+
+    with _process_pool(workers) as executor:
+        futures = [
+            executor.submit(
+                _extract_page_range, str(pdf_path), start, min(start + chunk_size, total_pages)
+            )
+            for start in range(0, total_pages, chunk_size)
+        ]
+        try:
+            for future in futures:
+                yield from future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int):
+    """Extract the text of pages [start, stop) - runs in a worker process."""
+    reader = PdfReader(pdf_path)
+    return [reader.pages[i].extract_text() for i in range(start, stop)]
+
+
 # -------------------------------------------------------------------
 # Time and Metric Extraction
 # -------------------------------------------------------------------
@@ -202,13 +487,107 @@ def extract_local_times(trip_text):
     Returns:
         List of time strings in HH:MM format
     """
-    times = []
-    pattern = re.compile(r"\((\d{1,2})\)(\d{2}):(\d{2})")
-    for match in pattern.finditer(trip_text):
-        local_hour = int(match.group(1))
-        minute = int(match.group(3))
-        times.append(f"{local_hour:02d}:{minute:02d}")
-    return times
+    return [f"{local_hour:02d}:{minute:02d}" for local_hour, minute in iter_local_times(trip_text)]
+
+
+def iter_local_times(trip_text):
+    """
+    Lazily yield the local times in trip text as integers.
+
+    Same matches as extract_local_times, without the round trip through an
+    "HH:MM" string, so callers testing each time can stop at the first hit.
+
+    Args:
+        trip_text: Raw trip text
+
+    Yields:
+        ``(local_hour, minute)`` integer tuples in text order
+    """
+    for match in _LOCAL_TIME_RE.finditer(trip_text):
+        local_hour, minute = match.group(1, 3)
+        yield _TWO_DIGIT_INTS[local_hour], _TWO_DIGIT_INTS[minute]
+
+
+def parse_trip_metrics(trip_text):
+    """
+    Extract the trip-level metrics (ID, frequency, TAFB, duty days) in one pass.
+
+    Runs a single combined regex over the trip text instead of one scan per
+    metric. Results are cached per trip text, so the single-purpose helpers
+    below (parse_trip_id, parse_tafb, ...) share the same scan.
+
+    Args:
+        trip_text: Raw trip text
+
+    Returns:
+        Dictionary with keys:
+        - trip_id: Trip ID as integer, or None if not found
+        - frequency: Number of times the trip runs (defaults to 1)
+        - tafb_hours: TAFB hours as float (0.0 if not found)
+        - duty_days: Number of "Duty XhYY" entries
+        - max_duty_length: Longest duty day in hours (0.0 if none)
+    """
+    trip_id, frequency, tafb_hours, duty_days, max_duty_length = _scan_trip_metrics(trip_text)
+    return {
+        "trip_id": trip_id,
+        "frequency": frequency,
+        "tafb_hours": tafb_hours,
+        "duty_days": duty_days,
+        "max_duty_length": max_duty_length,
+    }
+
+
+@lru_cache(maxsize=2048)
+def _scan_trip_metrics(trip_text):
+    """Single regex pass behind parse_trip_metrics; returns an immutable tuple."""
+    trip_id = None
+    frequency = None
+    tafb_hours = None
+    duty_days = 0
+    # Longest duty day so far, compared in whole minutes
+    max_duty_minutes = -1
+    max_duty_length = 0.0
+
+    for m in _TRIP_METRICS_RE.finditer(trip_text):
+        kind = m.lastgroup
+        if kind == "duty_m":
+            duty_days += 1
+            hours = int(m.group("duty_h"))
+            mins = int(m.group("duty_m"))
+            if hours * 60 + mins > max_duty_minutes:
+                max_duty_minutes = hours * 60 + mins
+                max_duty_length = hours + mins / 60.0
+        elif kind == "trip_id":
+            if trip_id is None:
+                trip_id = int(m.group("trip_id"))
+        elif kind == "tafb_m":
+            if tafb_hours is None:
+                tafb_hours = int(m.group("tafb_h")) + int(m.group("tafb_m")) / 60.0
+        elif frequency is None:
+            frequency = int(m.group("frequency"))
+
+    return (
+        trip_id,
+        # If no frequency found, assume it runs once
+        frequency if frequency is not None else 1,
+        tafb_hours if tafb_hours is not None else 0.0,
+        duty_days,
+        max_duty_length,
+    )
+
+
+def clear_trip_caches():
+    """
+    Drop the per-trip parse caches.
+
+    Called at the start of each report run so trips from a previously
+    analyzed PDF don't stay in memory.
+    """
+    _scan_trip_metrics.cache_clear()
+    _classify_trip_lines.cache_clear()
+    _flight_leg_lines.cache_clear()
+    _scan_duty_day_details.cache_clear()
+    _parse_trip_for_table_cached.cache_clear()
 
 
 def parse_trip_id(trip_text):
@@ -221,10 +600,7 @@ def parse_trip_id(trip_text):
     Returns:
         Trip ID as integer, or None if not found
     """
-    m = re.search(r"Trip\s*Id:\s*(\d+)", trip_text, re.IGNORECASE)
-    if m:
-        return int(m.group(1))
-    return None
+    return _scan_trip_metrics(trip_text)[0]
 
 
 def parse_tafb(trip_text):
@@ -237,12 +613,7 @@ def parse_tafb(trip_text):
     Returns:
         TAFB hours as float
     """
-    m = re.search(r"TAFB:\s*(\d+)h(\d+)", trip_text)
-    if not m:
-        return 0.0
-    hours = int(m.group(1))
-    mins = int(m.group(2))
-    return hours + mins / 60.0
+    return _scan_trip_metrics(trip_text)[2]
 
 
 def parse_duty_days(trip_text):
@@ -255,8 +626,7 @@ def parse_duty_days(trip_text):
     Returns:
         Number of duty days as integer
     """
-    duty_blocks = re.findall(r"(?i)Duty\s+\d+h\d+", trip_text)
-    return len(duty_blocks)
+    return _scan_trip_metrics(trip_text)[3]
 
 
 def parse_max_duty_day_length(trip_text):
@@ -271,18 +641,217 @@ def parse_max_duty_day_length(trip_text):
 
     Example patterns: "Duty 12h30", "Duty 8h15"
     """
-    duty_pattern = re.findall(r"(?i)Duty\s+(\d+)h(\d+)", trip_text)
-    if not duty_pattern:
-        return 0.0
+    return _scan_trip_metrics(trip_text)[4]
+
+
+def _is_flight_leg_line(stripped_lines, i):
+    """
+    Check whether line ``i`` of a duty day starts a flight leg.
+
+    Args:
+        stripped_lines: Trip text lines with surrounding whitespace removed
+        i: Index of the line to check
+
+    Returns:
+        True if the line is a flight number (multi-line or MD-11 format) or a
+        single-line flight record
+    """
+    stripped = stripped_lines[i]
+
+    # Cheap prefilter: most duty-day lines (times, durations, equipment, crew)
+    # have no carrier code and don't start with a flight number
+    upper = stripped.upper()
+    if (
+        "UPS" not in upper
+        and "DH" not in upper
+        and "GT" not in upper
+        and not stripped[:1].isdigit()
+    ):
+        return False
+
+    leg_match = _LEG_LINE_RE.match(stripped)
+    if leg_match:
+        # Multi-line format: Flight number on its own line (starts with UPS/DH/GT)
+        if leg_match.lastgroup == "flight":
+            return True
+        # MD-11 format: Bare 3-4 digit flight number followed by route
+        # (with optional suffix like (C))
+        return i + 1 < len(stripped_lines) and bool(_ROUTE_LINE_RE.match(stripped_lines[i + 1]))
+    # Single-line format: Flight data on one line with day pattern
+    # Pattern: "1 (Su)Su UPS5969 ONT-SDF ..." or "1 (  )   UPS 984 ONT-BFI ..."
+    if _CARRIER_RE.search(stripped):
+        # Verify it's a flight line (has route pattern or time pattern)
+        return bool(_ROUTE_RE.search(stripped) or _PAREN_TIME_RE.search(stripped))
+    return False
+
+
+@lru_cache(maxsize=4096)
+def _rounded_hours(hours_str, mins_str):
+    """
+    Convert an "XhYY" duration's digit groups to hours rounded to 2 decimals.
+
+    Durations repeat heavily across a pairing file (a few hundred distinct
+    values at most), so conversions are cached instead of re-parsed per line.
+    """
+    return round(int(hours_str) + int(mins_str) / 60.0, 2)
+
+
+def _duty_day_time_lines(lines, stripped_lines):
+    """
+    Pre-compute the Duty/Block/Credit times found on each line of a trip.
+
+    The duty-day windows searched by ``parse_duty_day_details`` overlap, so each
+    line is matched once here instead of once per window and per field.
+
+    Args:
+        lines: Raw trip text lines
+        stripped_lines: The same lines with surrounding whitespace removed
+
+    Returns:
+        Tuple ``(label_times, inline_times)`` of per-line lists:
+        - label_times[j]: ``(field, hours)`` when line j is a bare "Duty"/"Block"/"Credit"
+          label followed by an XhYY line (multi-line format), else None
+        - inline_times[j]: ``{field: hours}`` for "Duty 7h34"-style values embedded in
+          line j (single-line format), else None
+    """
+    num_lines = len(lines)
+    label_times = [None] * num_lines
+    inline_times = [None] * num_lines
+
+    for j in range(num_lines):
+        # Multi-line format: "Duty" on its own line, "7h44" on the next
+        # (a bare label is at most six characters once stripped)
+        label_match = len(stripped_lines[j]) <= 6 and _TIME_LABEL_RE.match(stripped_lines[j])
+        if label_match and j + 1 < num_lines:
+            # Credit format can be "6h19L" or "6h19"
+            time_match = _HOURS_MINUTES_RE.match(stripped_lines[j + 1])
+            if time_match:
+                field = _TIME_LABEL_FIELDS[label_match.group(1).lower()]
+                label_times[j] = (field, _rounded_hours(*time_match.group(1, 2)))
+
+        # Single-line format: "Duty 7h34", "Block 4h53", "Credit 6h19L" embedded in line
+        found = {}
+        for inline_match in _INLINE_TIME_RE.finditer(lines[j]):
+            field = _TIME_LABEL_FIELDS[inline_match.group(1).lower()]
+            if field not in found:
+                found[field] = _rounded_hours(*inline_match.group(2, 3))
+        if found:
+            # Avoid matching "Block Time:" / "Credit Time:" from trip summary
+            if "Block Time:" in lines[j]:
+                found.pop("block_hours", None)
+            if "Credit Time:" in lines[j]:
+                found.pop("credit_hours", None)
+            inline_times[j] = found or None
+
+    return label_times, inline_times
 
-    duty_lengths = []
-    for hours_str, mins_str in duty_pattern:
-        hours = int(hours_str)
-        mins = int(mins_str)
-        total_hours = hours + mins / 60.0
-        duty_lengths.append(total_hours)
 
-    return max(duty_lengths) if duty_lengths else 0.0
+def _indices_between(indices, start, stop):
+    """Return the entries of the sorted list ``indices`` that fall in [start, stop)."""
+    return indices[bisect_left(indices, start) : bisect_left(indices, stop)]
+
+
+def _duty_day_boundary_lines(trip_text, lines, stripped_lines):
+    """
+    Flag the lines that open or may close a duty day.
+
+    Every boundary test depends only on the line and its neighbours, so the
+    whole trip is classified in one pass before the duty-day loop runs.
+
+    Args:
+        trip_text: Raw trip text
+        lines: Raw trip text lines (``trip_text.split("\n")``)
+        stripped_lines: The same lines with surrounding whitespace removed
+
+    Returns:
+        Tuple ``(starts, debriefings, fallback_ends)`` of per-line booleans:
+        - starts[i]: "Briefing" line, or fallback duty start without "Briefing"
+        - debriefings[i]: "Debriefing" line
+        - fallback_ends[i]: (HH)MM:SS followed by 0h15/0h30 without "Debriefing";
+          only a duty-day end once legs have been counted in that duty day
+    """
+    num_lines = len(lines)
+    briefings = [False] * num_lines
+    debriefings = [False] * num_lines
+    # One scan of the whole trip finds the candidate lines; each match is mapped
+    # back to its line by counting the line breaks since the previous match
+    line_index = 0
+    line_scan_pos = 0
+    for match in _BRIEFING_SUFFIX_RE.finditer(trip_text):
+        line_index += trip_text.count("\n", line_scan_pos, match.start())
+        line_scan_pos = match.start()
+        line = lines[line_index]
+        briefings[line_index] = bool(_BRIEFING_RE.search(line))
+        debriefings[line_index] = bool(_DEBRIEFING_RE.search(line))
+    starts = list(briefings)
+    fallback_ends = [False] * num_lines
+
+    # The fallback patterns are only for older PDFs that have no Briefing /
+    # Debriefing markers at all; trips using the markers skip them entirely
+    use_fallback_starts = not any(briefings)
+    use_fallback_ends = not any(debriefings)
+    if not (use_fallback_starts or use_fallback_ends):
+        return starts, debriefings, fallback_ends
+
+    for i in range(num_lines - 1):
+        if not _has_paren_time_prefix(stripped_lines[i]):
+            continue
+
+        # Fallback: detect duty start without "Briefing"
+        if (
+            use_fallback_starts
+            and i + 3 < num_lines
+            and _has_duration_prefix(stripped_lines[i + 1])
+            and stripped_lines[i + 2] == "Duty"
+        ):
+            starts[i] = True
+
+        # Fallback: Detect duty day end without "Debriefing" keyword
+        # Pattern: (HH)MM:SS followed by short duration (debrief is typically 0h15 or 0h30)
+        if use_fallback_ends and stripped_lines[i + 1].startswith(("0h15", "0h30")):
+            fallback_ends[i] = True
+
+    return starts, debriefings, fallback_ends
+
+
+@lru_cache(maxsize=4096)
+def _classify_trip_lines(trip_text):
+    """
+    Split a trip into lines and flag its duty-day boundaries, once per trip text.
+
+    parse_max_legs_per_duty_day, parse_duty_day_details and parse_trip_for_table
+    all walk the same trip; they share this pre-scan instead of each repeating it.
+
+    Returns:
+        Tuple ``(lines, stripped_lines, starts, debriefings, fallback_ends)`` of
+        tuples (see _duty_day_boundary_lines). Callers must not modify them.
+    """
+    lines = trip_text.split("\n")
+    stripped_lines = [line.strip() for line in lines]
+    starts, debriefings, fallback_ends = _duty_day_boundary_lines(trip_text, lines, stripped_lines)
+    return (
+        tuple(lines),
+        tuple(stripped_lines),
+        tuple(starts),
+        tuple(debriefings),
+        tuple(fallback_ends),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _flight_leg_lines(trip_text):
+    """
+    Flag the lines of a trip that start a flight leg, once per trip text.
+
+    parse_max_legs_per_duty_day and parse_duty_day_details both count legs
+    over the same duty days; sharing the flags runs each line through
+    _is_flight_leg_line once instead of twice.
+
+    Returns:
+        Tuple of per-line booleans (see _is_flight_leg_line)
+    """
+    stripped_lines = _classify_trip_lines(trip_text)[1]
+    return tuple(_is_flight_leg_line(stripped_lines, i) for i in range(len(stripped_lines)))
 
 
 def parse_max_legs_per_duty_day(trip_text):
@@ -303,62 +872,24 @@ def parse_max_legs_per_duty_day(trip_text):
 
     Example: A trip with duty days containing 2, 1, and 4 legs would return 4.
     """
-    # Split text into lines
-    lines = trip_text.split("\n")
+    # Split text into lines and flag duty-day boundaries (shared with the other parsers)
+    lines, _, starts, debriefings, fallback_ends = _classify_trip_lines(trip_text)
+    leg_lines = _flight_leg_lines(trip_text)
 
     legs_per_duty_day = []
     current_duty_legs = 0
     in_duty = False
 
-    for i, line in enumerate(lines):
+    for i in range(len(lines)):
         # Check if we're starting a duty day
-        is_briefing = re.search(r"\bBriefing\b", line, re.IGNORECASE)
-
-        # Fallback: detect duty start without "Briefing"
-        # Only use fallback when we didn't recently see "Briefing" keyword
-        is_fallback_start = False
-        if not is_briefing and i + 3 < len(lines):
-            # Check if "Briefing" appeared in the last 2 lines
-            recent_briefing = any(
-                i - offset >= 0 and re.search(r"\bBriefing\b", lines[i - offset], re.IGNORECASE)
-                for offset in range(1, 3)
-            )
-
-            if not recent_briefing:
-                time_match = re.match(r"\((\d+)\)(\d{2}:\d{2})", line.strip())
-                duration_match = re.match(r"(\d+)h(\d+)", lines[i + 1].strip())
-                duty_label = lines[i + 2].strip() == "Duty"
-                if time_match and duration_match and duty_label:
-                    is_fallback_start = True
-
-        if is_briefing or is_fallback_start:
+        if starts[i]:
             in_duty = True
             current_duty_legs = 0
 
         # Check if we're ending a duty day
-        is_debriefing = re.search(r"\bDebriefing\b", line, re.IGNORECASE)
-
-        # Fallback: Detect duty day end without "Debriefing" keyword
-        # Pattern: (HH)MM:SS followed by short duration (0h15 or 0h30)
-        is_fallback_end = False
-        if in_duty and not is_debriefing and i + 1 < len(lines):
-            # Check if "Debriefing" appeared in the last 2 lines
-            recent_debriefing = any(
-                i - offset >= 0 and re.search(r"\bDebriefing\b", lines[i - offset], re.IGNORECASE)
-                for offset in range(1, 3)
-            )
-
-            if not recent_debriefing:
-                # Check if current line is a time pattern
-                time_match = re.match(r"\((\d+)\)(\d{2}:\d{2})", line.strip())
-                # Next line should be a short duration (debrief is typically 0h15 or 0h30)
-                duration_match = (
-                    re.match(r"0h(15|30)", lines[i + 1].strip()) if i + 1 < len(lines) else None
-                )
-
-                if time_match and duration_match and current_duty_legs > 0:
-                    # Only consider this a debrief if we've counted legs in this duty day
-                    is_fallback_end = True
+        # Only consider a fallback debrief if we've counted legs in this duty day
+        is_debriefing = debriefings[i]
+        is_fallback_end = in_duty and fallback_ends[i] and current_duty_legs > 0
 
         if is_debriefing or is_fallback_end:
             if in_duty:
@@ -366,28 +897,8 @@ def parse_max_legs_per_duty_day(trip_text):
                 in_duty = False
                 current_duty_legs = 0
         # Count flight legs
-        elif in_duty:
-            stripped = line.strip()
-
-            # Multi-line format: Flight number on its own line
-            # Match lines starting with UPS/DH/GT
-            if re.match(r"^(UPS|DH|GT)(\s|\d|N/A)", stripped, re.IGNORECASE):
-                current_duty_legs += 1
-            # MD-11 format: Bare 3-4 digit flight number followed by route
-            elif re.match(r"^\d{3,4}$", stripped):
-                # Verify next line is a route (with optional suffix like (C))
-                if i + 1 < len(lines) and re.match(
-                    r"^[A-Z]{3}-[A-Z]{3}(\([A-Z]\))?$", lines[i + 1].strip()
-                ):
-                    current_duty_legs += 1
-            # Single-line format: Flight data on one line with day pattern
-            # Pattern: "1 (Su)Su UPS5969 ONT-SDF ..." or "1 (  )   UPS 984 ONT-BFI ..."
-            elif re.search(r"(UPS|DH|GT)", stripped, re.IGNORECASE):
-                # Verify it's a flight line (has route pattern or time pattern)
-                if re.search(r"[A-Z]{3}-[A-Z]{3}", stripped) or re.search(
-                    r"\(\d+\)\d{2}:\d{2}", stripped
-                ):
-                    current_duty_legs += 1
+        elif in_duty and leg_lines[i]:
+            current_duty_legs += 1
 
     # Handle case where duty day doesn't have debriefing (incomplete data)
     if in_duty and current_duty_legs > 0:
@@ -413,72 +924,53 @@ def parse_duty_day_details(trip_text, is_edw_func):
         ]
 
     Returns empty list if no duty days found.
+
+    The line scan is cached per trip text (see clear_trip_caches); only the
+    EDW check runs on every call.
     """
-    lines = trip_text.split("\n")
+    lines, duty_days = _scan_duty_day_details(trip_text)
+    return [
+        {**duty_day, "is_edw": is_edw_func("\n".join(lines[start:end]))}
+        for duty_day, start, end in duty_days
+    ]
+
+
+@lru_cache(maxsize=4096)
+def _scan_duty_day_details(trip_text):
+    """
+    Cached line scan behind parse_duty_day_details.
+
+    Returns:
+        Tuple ``(lines, duty_days)`` where duty_days holds ``(duty_day, start, end)``
+        entries: the duty day dict (with is_edw unset) and the line slice
+        ``lines[start:end]`` passed to the EDW check. Callers must not modify it.
+    """
+    lines, stripped_lines, starts, debriefings, fallback_ends = _classify_trip_lines(trip_text)
+    label_times, inline_times = _duty_day_time_lines(lines, stripped_lines)
+    leg_lines = _flight_leg_lines(trip_text)
+    # Sorted indices of the lines carrying a time, so each duty-day window only
+    # visits those lines instead of every line in the window
+    label_lines = [j for j, label in enumerate(label_times) if label]
+    time_lines = [j for j, label in enumerate(label_times) if label or inline_times[j]]
 
     duty_day_details = []
     current_duty_day = None
     duty_day_number = 0
     briefing_line_idx = None
 
-    for i, line in enumerate(lines):
+    num_lines = len(lines)
+    for i in range(num_lines):
         # Start of a new duty day (Briefing OR fallback pattern)
-        is_briefing = re.search(r"\bBriefing\b", line, re.IGNORECASE)
-
-        # Fallback: detect duty start without "Briefing"
-        # Only use fallback when we didn't recently see "Briefing" keyword
-        is_fallback_start = False
-        if not is_briefing and i + 3 < len(lines):
-            # Check if "Briefing" appeared in the last 2 lines
-            recent_briefing = any(
-                i - offset >= 0 and re.search(r"\bBriefing\b", lines[i - offset], re.IGNORECASE)
-                for offset in range(1, 3)
-            )
-
-            if not recent_briefing:
-                time_match = re.match(r"\((\d+)\)(\d{2}:\d{2})", line.strip())
-                duration_match = re.match(r"(\d+)h(\d+)", lines[i + 1].strip())
-                duty_label = lines[i + 2].strip() == "Duty"
-                if time_match and duration_match and duty_label:
-                    is_fallback_start = True
-
-        if is_briefing or is_fallback_start:
+        if starts[i]:
             if current_duty_day:
                 # Extract duty/block/credit times before appending (for MD-11 format without Debriefing)
                 if briefing_line_idx is not None and current_duty_day["duration_hours"] == 0.0:
-                    for j in range(briefing_line_idx, i):
-                        # Multi-line format: "Duty" on its own line
-                        duty_match = re.match(r"^\s*Duty\s*$", lines[j].strip(), re.IGNORECASE)
-                        if duty_match and j + 1 < len(lines):
-                            time_match = re.match(r"(\d+)h(\d+)", lines[j + 1].strip())
-                            if time_match:
-                                hours = int(time_match.group(1))
-                                mins = int(time_match.group(2))
-                                current_duty_day["duration_hours"] = round(hours + mins / 60.0, 2)
-
-                        # Block time
-                        block_match = re.match(r"^\s*Block\s*$", lines[j].strip(), re.IGNORECASE)
-                        if block_match and j + 1 < len(lines):
-                            time_match = re.match(r"(\d+)h(\d+)", lines[j + 1].strip())
-                            if time_match:
-                                hours = int(time_match.group(1))
-                                mins = int(time_match.group(2))
-                                current_duty_day["block_hours"] = round(hours + mins / 60.0, 2)
-
-                        # Credit time
-                        credit_match = re.match(r"^\s*Credit\s*$", lines[j].strip(), re.IGNORECASE)
-                        if credit_match and j + 1 < len(lines):
-                            time_match = re.match(r"(\d+)h(\d+)", lines[j + 1].strip())
-                            if time_match:
-                                hours = int(time_match.group(1))
-                                mins = int(time_match.group(2))
-                                current_duty_day["credit_hours"] = round(hours + mins / 60.0, 2)
-
-                # Check if this duty day is EDW before appending
-                if briefing_line_idx is not None:
-                    duty_day_text = "\n".join(lines[briefing_line_idx:i])
-                    current_duty_day["is_edw"] = is_edw_func(duty_day_text)
-                duty_day_details.append(current_duty_day)
+                    for j in _indices_between(label_lines, briefing_line_idx, i):
+                        field, hours = label_times[j]
+                        current_duty_day[field] = hours
+
+                # EDW is checked on lines[briefing_line_idx:i] by the caller
+                duty_day_details.append((current_duty_day, briefing_line_idx, i))
 
             duty_day_number += 1
             briefing_line_idx = i
@@ -492,29 +984,9 @@ def parse_duty_day_details(trip_text, is_edw_func):
             }
 
         # End of duty day - capture duration and block time by searching between briefing and debriefing
-        is_debriefing = re.search(r"\bDebriefing\b", line, re.IGNORECASE)
-
-        # Fallback: Detect duty day end without "Debriefing" keyword
-        # Pattern: (HH)MM:SS followed by short duration (0h15 or 0h30)
-        is_fallback_end = False
-        if current_duty_day and not is_debriefing and i + 1 < len(lines):
-            # Check if "Debriefing" appeared in the last 2 lines
-            recent_debriefing = any(
-                i - offset >= 0 and re.search(r"\bDebriefing\b", lines[i - offset], re.IGNORECASE)
-                for offset in range(1, 3)
-            )
-
-            if not recent_debriefing:
-                # Check if current line is a time pattern
-                time_match = re.match(r"\((\d+)\)(\d{2}:\d{2})", line.strip())
-                # Next line should be a short duration (debrief is typically 0h15 or 0h30)
-                duration_match = (
-                    re.match(r"0h(15|30)", lines[i + 1].strip()) if i + 1 < len(lines) else None
-                )
-
-                if time_match and duration_match and current_duty_day["num_legs"] > 0:
-                    # Only consider this a debrief if we've counted legs in this duty day
-                    is_fallback_end = True
+        # Only consider a fallback debrief if we've counted legs in this duty day
+        is_debriefing = debriefings[i]
+        is_fallback_end = current_duty_day and fallback_ends[i] and current_duty_day["num_legs"] > 0
 
         if current_duty_day and (is_debriefing or is_fallback_end):
             # Search from briefing through a few lines after debriefing for "Duty", "Block", and "Credit" times
@@ -523,129 +995,34 @@ def parse_duty_day_details(trip_text, is_edw_func):
             # - Single-line: "Briefing (00)08:50 1h00 Duty 7h34 Crew: 1/1/0"
             if briefing_line_idx is not None:
                 # Search up to 5 lines after debriefing to catch duty/block/credit times
-                search_end = min(i + 6, len(lines))
-                for j in range(briefing_line_idx, search_end):
-                    # Multi-line format: "Duty" on its own line
-                    duty_match = re.match(r"^\s*Duty\s*$", lines[j].strip(), re.IGNORECASE)
-                    if duty_match and j + 1 < len(lines):
-                        time_match = re.match(r"(\d+)h(\d+)", lines[j + 1].strip())
-                        if time_match:
-                            hours = int(time_match.group(1))
-                            mins = int(time_match.group(2))
-                            current_duty_day["duration_hours"] = round(hours + mins / 60.0, 2)
-
-                    # Single-line format: "Duty 7h34" embedded in line
-                    inline_duty_match = re.search(r"\bDuty\s+(\d+)h(\d+)", lines[j])
-                    if inline_duty_match and current_duty_day["duration_hours"] == 0.0:
-                        hours = int(inline_duty_match.group(1))
-                        mins = int(inline_duty_match.group(2))
-                        current_duty_day["duration_hours"] = round(hours + mins / 60.0, 2)
-
-                    # Block time - Multi-line format: "Block" on its own line
-                    block_match = re.match(r"^\s*Block\s*$", lines[j].strip(), re.IGNORECASE)
-                    if block_match and j + 1 < len(lines):
-                        time_match = re.match(r"(\d+)h(\d+)", lines[j + 1].strip())
-                        if time_match:
-                            hours = int(time_match.group(1))
-                            mins = int(time_match.group(2))
-                            current_duty_day["block_hours"] = round(hours + mins / 60.0, 2)
-
-                    # Single-line format: "Block 4h53" embedded in line
-                    # Avoid matching "Block Time:" from trip summary
-                    inline_block_match = re.search(r"\bBlock\s+(\d+)h(\d+)", lines[j])
-                    if (
-                        inline_block_match
-                        and "Block Time:" not in lines[j]
-                        and current_duty_day["block_hours"] == 0.0
-                    ):
-                        hours = int(inline_block_match.group(1))
-                        mins = int(inline_block_match.group(2))
-                        current_duty_day["block_hours"] = round(hours + mins / 60.0, 2)
-
-                    # Credit time - Multi-line format: "Credit" on its own line
-                    credit_match = re.match(r"^\s*Credit\s*$", lines[j].strip(), re.IGNORECASE)
-                    if credit_match and j + 1 < len(lines):
-                        # Credit format can be "6h19L" or "6h19"
-                        time_match = re.match(r"(\d+)h(\d+)", lines[j + 1].strip())
-                        if time_match:
-                            hours = int(time_match.group(1))
-                            mins = int(time_match.group(2))
-                            current_duty_day["credit_hours"] = round(hours + mins / 60.0, 2)
-
-                    # Single-line format: "Credit 6h19L" embedded in line
-                    # Avoid matching "Credit Time:" from trip summary
-                    inline_credit_match = re.search(r"\bCredit\s+(\d+)h(\d+)", lines[j])
-                    if (
-                        inline_credit_match
-                        and "Credit Time:" not in lines[j]
-                        and current_duty_day["credit_hours"] == 0.0
-                    ):
-                        hours = int(inline_credit_match.group(1))
-                        mins = int(inline_credit_match.group(2))
-                        current_duty_day["credit_hours"] = round(hours + mins / 60.0, 2)
+                search_end = min(i + 6, num_lines)
+                for j in _indices_between(time_lines, briefing_line_idx, search_end):
+                    if label_times[j]:
+                        field, hours = label_times[j]
+                        current_duty_day[field] = hours
+
+                    # Inline values only fill fields not already set by a labelled value
+                    if inline_times[j]:
+                        for field, hours in inline_times[j].items():
+                            if current_duty_day[field] == 0.0:
+                                current_duty_day[field] = hours
 
         # Count flight legs within duty day
-        elif current_duty_day:
-            stripped = line.strip()
-
-            # Multi-line format: Flight number on its own line (starts with UPS/DH/GT)
-            if re.match(r"^(UPS|DH|GT)(\s|\d|N/A)", stripped, re.IGNORECASE):
-                current_duty_day["num_legs"] += 1
-            # MD-11 format: Bare 3-4 digit flight number followed by route
-            elif re.match(r"^\d{3,4}$", stripped):
-                # Verify next line is a route (with optional suffix like (C))
-                if i + 1 < len(lines) and re.match(
-                    r"^[A-Z]{3}-[A-Z]{3}(\([A-Z]\))?$", lines[i + 1].strip()
-                ):
-                    current_duty_day["num_legs"] += 1
-            # Single-line format: Flight data on one line with day pattern
-            # Pattern: "1 (  )   UPS 984 ONT-BFI ..." or contains UPS/DH/GT with route
-            elif re.search(r"(UPS|DH|GT)", stripped, re.IGNORECASE):
-                # Verify it's a flight line (has route pattern or time pattern)
-                if re.search(r"[A-Z]{3}-[A-Z]{3}", stripped) or re.search(
-                    r"\(\d+\)\d{2}:\d{2}", stripped
-                ):
-                    current_duty_day["num_legs"] += 1
+        elif current_duty_day and leg_lines[i]:
+            current_duty_day["num_legs"] += 1
 
     # Don't forget the last duty day
     if current_duty_day:
         # Extract duty/block times for last duty day (for MD-11 format without Debriefing)
         if briefing_line_idx is not None and current_duty_day["duration_hours"] == 0.0:
-            for j in range(briefing_line_idx, len(lines)):
-                # Multi-line format: "Duty" on its own line
-                duty_match = re.match(r"^\s*Duty\s*$", lines[j].strip(), re.IGNORECASE)
-                if duty_match and j + 1 < len(lines):
-                    time_match = re.match(r"(\d+)h(\d+)", lines[j + 1].strip())
-                    if time_match:
-                        hours = int(time_match.group(1))
-                        mins = int(time_match.group(2))
-                        current_duty_day["duration_hours"] = round(hours + mins / 60.0, 2)
-
-                # Block time
-                block_match = re.match(r"^\s*Block\s*$", lines[j].strip(), re.IGNORECASE)
-                if block_match and j + 1 < len(lines):
-                    time_match = re.match(r"(\d+)h(\d+)", lines[j + 1].strip())
-                    if time_match:
-                        hours = int(time_match.group(1))
-                        mins = int(time_match.group(2))
-                        current_duty_day["block_hours"] = round(hours + mins / 60.0, 2)
-
-                # Credit time
-                credit_match = re.match(r"^\s*Credit\s*$", lines[j].strip(), re.IGNORECASE)
-                if credit_match and j + 1 < len(lines):
-                    time_match = re.match(r"(\d+)h(\d+)", lines[j + 1].strip())
-                    if time_match:
-                        hours = int(time_match.group(1))
-                        mins = int(time_match.group(2))
-                        current_duty_day["credit_hours"] = round(hours + mins / 60.0, 2)
-
-        # Check EDW for the last duty day
-        if briefing_line_idx is not None:
-            duty_day_text = "\n".join(lines[briefing_line_idx:])
-            current_duty_day["is_edw"] = is_edw_func(duty_day_text)
-        duty_day_details.append(current_duty_day)
-
-    return duty_day_details
+            for j in _indices_between(label_lines, briefing_line_idx, num_lines):
+                field, hours = label_times[j]
+                current_duty_day[field] = hours
+
+        # EDW for the last duty day is checked on lines[briefing_line_idx:]
+        duty_day_details.append((current_duty_day, briefing_line_idx, None))
+
+    return tuple(lines), tuple(duty_day_details)
 
 
 def parse_trip_frequency(trip_text):
@@ -660,11 +1037,74 @@ def parse_trip_frequency(trip_text):
 
     Looks for patterns like "(5 trips)" or "(4 trips)"
     """
-    m = re.search(r"\((\d+)\s+trips?\)", trip_text, re.IGNORECASE)
-    if m:
-        return int(m.group(1))
-    # If no frequency found, assume it runs once
-    return 1
+    return _scan_trip_metrics(trip_text)[1]
+
+
+# -------------------------------------------------------------------
+# Line Shape Checks
+# -------------------------------------------------------------------
+# Plain string tests for the anchored line shapes parse_trip_for_table probes
+# on nearly every line; most lines fail on the first character, so these
+# avoid entering the regex engine at all.
+_ASCII_DIGITS = frozenset("0123456789")
+
+
+def _has_day_prefix(line):
+    """Day pattern at line start: digits, whitespace, "(" - e.g. "1 (Su)Su ..."."""
+    return line[:1].isdecimal() and _DAY_PREFIX_RE.match(line) is not None
+
+
+def _has_carrier_prefix(line):
+    """Line starts with a UPS, GT or DH carrier code (any case)."""
+    return line[:3].upper() == "UPS" or line[:2].upper() in ("GT", "DH")
+
+
+def _is_bare_flight_number(line):
+    """MD-11 bare flight number: exactly 3-4 digits."""
+    return 3 <= len(line) <= 4 and line.isdecimal()
+
+
+def _is_aircraft_type(line):
+    """Aircraft type code: two ASCII digits and an uppercase letter, e.g. "76P"."""
+    return (
+        len(line) == 3
+        and line[0] in _ASCII_DIGITS
+        and line[1] in _ASCII_DIGITS
+        and "A" <= line[2] <= "Z"
+    )
+
+
+def _is_crew_need(line):
+    """Crew complement: three digit groups separated by "/", e.g. "1/1/0"."""
+    parts = line.split("/")
+    return len(parts) == 3 and all(part.isdecimal() for part in parts)
+
+
+def _is_duration(line):
+    """Whole line is an XhYY duration, e.g. "1h48"."""
+    hours, sep, minutes = line.partition("h")
+    return bool(sep) and hours.isdecimal() and minutes.isdecimal()
+
+
+def _has_duration_prefix(line):
+    """Line starts with an XhY duration, e.g. "4h50" or "6h19L"."""
+    hours, sep, rest = line.partition("h")
+    return bool(sep) and hours.isdecimal() and rest[:1].isdecimal()
+
+
+def _has_paren_time_prefix(line):
+    """Line starts with a (HH)HH:MM time, e.g. "(06)14:30"."""
+    if line[:1] != "(":
+        return False
+    hour, sep, rest = line[1:].partition(")")
+    return (
+        bool(sep)
+        and hour.isdecimal()
+        and len(rest) >= 5
+        and rest[2] == ":"
+        and rest[:2].isdecimal()
+        and rest[3:5].isdecimal()
+    )
 
 
 def parse_trip_for_table(trip_text, is_edw_func):
@@ -675,6 +1115,9 @@ def parse_trip_for_table(trip_text, is_edw_func):
     This version doesn't rely on fixed line skip counts, making it more resilient
     to format variations between different flight types (UPS, GT, DH) and PDF templates.
 
+    Results are cached per trip text (see clear_trip_caches); each call returns
+    its own copy, so callers may modify it freely.
+
     Args:
         trip_text: Raw trip text
         is_edw_func: Function to determine if text is EDW (from analyzer module)
@@ -697,16 +1140,39 @@ def parse_trip_for_table(trip_text, is_edw_func):
             'trip_summary': {...}
         }
     """
-    lines = trip_text.split("\n")
+    return _copy_trip_table(_parse_trip_for_table_cached(trip_text))
+
+
+def _copy_trip_table(table):
+    """
+    Copy a parse_trip_for_table result level by level.
+
+    Every leaf is a str, int or None, so only the dicts and lists need fresh
+    copies; this is far cheaper than copy.deepcopy's generic memoized walk.
+    """
+    return {
+        "trip_id": table["trip_id"],
+        "date_freq": table["date_freq"],
+        "duty_days": [
+            {**duty, "flights": [dict(flight) for flight in duty["flights"]]}
+            for duty in table["duty_days"]
+        ],
+        "trip_summary": dict(table["trip_summary"]),
+    }
+
+
+@lru_cache(maxsize=4096)
+def _parse_trip_for_table_cached(trip_text):
+    """Cached body of parse_trip_for_table - the table layout doesn't depend on is_edw_func."""
+    lines, stripped_lines, starts, debriefings, fallback_ends = _classify_trip_lines(trip_text)
+    num_lines = len(lines)
 
     trip_id = parse_trip_id(trip_text)
 
     # Find date/frequency line
     date_freq = None
     for line in lines:
-        if re.search(r"\d+\s+trips?\)", line, re.IGNORECASE) or re.search(
-            r"Only on|^\d{2}\w{3}\d{4}", line, re.IGNORECASE
-        ):
+        if _DATE_FREQUENCY_RE.search(line) or _DATE_ONLY_ON_RE.search(line):
             date_freq = line.strip()
             break
 
@@ -714,37 +1180,14 @@ def parse_trip_for_table(trip_text, is_edw_func):
     current_duty = None
     i = 0
 
-    while i < len(lines):
-        line = lines[i].strip()
+    while i < num_lines:
+        line = stripped_lines[i]
 
         # Start of duty day (Briefing marker OR fallback pattern for older PDFs)
-        is_briefing = re.search(r"\bBriefing\b", line, re.IGNORECASE)
-
-        # Fallback: Detect duty day start pattern without "Briefing" keyword
-        # Pattern: (HH)MM:SS followed by duration followed by "Duty" label
-        # Only use fallback when we didn't recently see "Briefing" keyword
-        is_fallback_duty_start = False
-        if not is_briefing and i + 3 < len(lines):
-            # Check if "Briefing" appeared in the last 2 lines
-            recent_briefing = any(
-                i - offset >= 0 and re.search(r"\bBriefing\b", lines[i - offset], re.IGNORECASE)
-                for offset in range(1, 3)
-            )
-
-            if not recent_briefing:
-                # Check if current line is a time pattern
-                time_match = re.match(r"\((\d+)\)(\d{2}:\d{2})", line)
-                # Next line should be duration
-                duration_match = (
-                    re.match(r"(\d+)h(\d+)", lines[i + 1].strip()) if i + 1 < len(lines) else None
-                )
-                # Line after that should be "Duty" label
-                duty_label = lines[i + 2].strip() == "Duty" if i + 2 < len(lines) else False
-
-                if time_match and duration_match and duty_label:
-                    is_fallback_duty_start = True
+        # Fallback: (HH)MM:SS followed by duration followed by "Duty" label
+        is_fallback_duty_start = starts[i] and not _BRIEFING_RE.search(line)
 
-        if is_briefing or is_fallback_duty_start:
+        if starts[i]:
             if current_duty:
                 duty_days.append(current_duty)
 
@@ -755,12 +1198,12 @@ def parse_trip_for_table(trip_text, is_edw_func):
             duty_time_val = None
 
             # Try to extract from same line (single-line format or Briefing marker)
-            time_match = re.search(r"\((\d+)\)(\d{2}:\d{2})", line)
+            time_match = _PAREN_TIME_RE.search(line)
             if time_match:
                 duty_start = f"({time_match.group(1)}){time_match.group(2)}"
 
             # Extract Duty time if on same line
-            duty_match = re.search(r"\bDuty\s+(\d+h\d+)", line)
+            duty_match = _INLINE_DUTY_TIME_RE.search(line)
             if duty_match:
                 duty_time_val = duty_match.group(1)
 
@@ -770,13 +1213,13 @@ def parse_trip_for_table(trip_text, is_edw_func):
                 if not duty_start:
                     duty_start = line
                 # Line i+3: duration value after "Duty" label
-                if i + 3 < len(lines) and not duty_time_val:
-                    duty_time_val = lines[i + 3].strip()
+                if i + 3 < num_lines and not duty_time_val:
+                    duty_time_val = stripped_lines[i + 3]
 
             # If not found yet, check next line (multi-line format with Briefing)
-            if not duty_start and i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
-                if re.match(r"\(\d+\)\d{2}:\d{2}", next_line):
+            if not duty_start and i + 1 < num_lines:
+                next_line = stripped_lines[i + 1]
+                if _has_paren_time_prefix(next_line):
                     duty_start = next_line
 
             current_duty = {
@@ -792,30 +1235,13 @@ def parse_trip_for_table(trip_text, is_edw_func):
             continue
 
         # End of duty day (Debriefing marker OR fallback pattern)
-        is_debriefing = re.search(r"\bDebriefing\b", line, re.IGNORECASE)
-
-        # Fallback: Detect duty day end without "Debriefing" keyword
-        # Pattern: (HH)MM:SS followed by short duration (0h15 or 0h30)
-        # This detects standalone debrief times in older PDFs without "Debriefing" label
-        is_fallback_duty_end = False
-        if current_duty and not is_debriefing and i + 1 < len(lines):
-            # Check if "Debriefing" appeared in the last 2 lines
-            recent_debriefing = any(
-                i - offset >= 0 and re.search(r"\bDebriefing\b", lines[i - offset], re.IGNORECASE)
-                for offset in range(1, 3)
-            )
-
-            if not recent_debriefing:
-                # Check if current line is a time pattern
-                time_match = re.match(r"\((\d+)\)(\d{2}:\d{2})", line)
-                # Next line should be a short duration (debrief is typically 0h15 or 0h30)
-                duration_match = (
-                    re.match(r"0h(15|30)", lines[i + 1].strip()) if i + 1 < len(lines) else None
-                )
-
-                if time_match and duration_match and len(current_duty.get("flights", [])) > 0:
-                    # Only consider this a debrief if we've seen flights in this duty day
-                    is_fallback_duty_end = True
+        # Fallback: (HH)MM:SS followed by short duration (0h15 or 0h30) without
+        # "Debriefing" - standalone debrief times in older PDFs.
+        # Only consider this a debrief if we've seen flights in this duty day
+        is_debriefing = debriefings[i]
+        is_fallback_duty_end = (
+            current_duty and fallback_ends[i] and len(current_duty.get("flights", [])) > 0
+        )
 
         if current_duty and (is_debriefing or is_fallback_duty_end):
             # Capture debriefing time and credit from the line
@@ -824,27 +1250,27 @@ def parse_trip_for_table(trip_text, is_edw_func):
             # Fallback format: "Duty Time:" followed by duration, then time
 
             # Try to extract from same line (single-line format)
-            time_match = re.search(r"\((\d+)\)(\d{2}:\d{2})", line)
+            time_match = _PAREN_TIME_RE.search(line)
             if time_match:
                 current_duty["duty_end"] = f"({time_match.group(1)}){time_match.group(2)}"
 
             # Fallback: For "Duty Time:" pattern, duty end time is 2 lines down
-            if is_fallback_duty_end and i + 2 < len(lines):
+            if is_fallback_duty_end and i + 2 < num_lines:
                 # Line i+1 is the duty time value (already captured)
                 # Line i+2 is the duty end time
-                end_time_line = lines[i + 2].strip()
-                if re.match(r"\(\d+\)\d{2}:\d{2}", end_time_line):
+                end_time_line = stripped_lines[i + 2]
+                if _has_paren_time_prefix(end_time_line):
                     current_duty["duty_end"] = end_time_line
 
             # Extract Credit if on same line
-            credit_match = re.search(r"\bCredit\s+(\S+)", line)
+            credit_match = _INLINE_CREDIT_VALUE_RE.search(line)
             if credit_match:
                 current_duty["credit"] = credit_match.group(1)
 
             # If not on same line, check next line (multi-line format)
-            if not current_duty["duty_end"] and i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
-                if re.match(r"\(\d+\)\d{2}:\d{2}", next_line):
+            if not current_duty["duty_end"] and i + 1 < num_lines:
+                next_line = stripped_lines[i + 1]
+                if _has_paren_time_prefix(next_line):
                     current_duty["duty_end"] = next_line
 
             i += 1
@@ -856,7 +1282,7 @@ def parse_trip_for_table(trip_text, is_edw_func):
             # Handles both single-line and multi-line flight formats
             is_flight = False
             is_single_line = False
-            has_day_pattern = re.match(r"^\d+\s+\(", line)
+            has_day_pattern = _has_day_prefix(line)
 
             # Initialize multi-line format variables (used only if not single-line)
             day_info = None
@@ -864,47 +1290,41 @@ def parse_trip_for_table(trip_text, is_edw_func):
             data_start_offset = 0
 
             # Check if this is single-line format (all data on one line)
-            if has_day_pattern and re.search(r"(UPS|GT|DH)", line, re.IGNORECASE):
+            if has_day_pattern and _CARRIER_RE.search(line):
                 # Single-line format: "1 (Su)Su UPS5969 ONT-SDF (06)14:30 ..."
                 is_flight = True
                 is_single_line = True
 
             # Case 1: Multi-line format - Day pattern followed by flight number on next line
-            elif has_day_pattern and i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
-                if re.match(r"^(UPS|GT|DH)", next_line, re.IGNORECASE):
+            elif has_day_pattern and i + 1 < num_lines:
+                next_line = stripped_lines[i + 1]
+                if _has_carrier_prefix(next_line):
                     is_flight = True
                     day_info = line
                     flight_num = next_line
                     data_start_offset = 2  # Route starts at i+2
                 # MD-11 format: Day pattern followed by bare numeric flight number
-                elif re.match(r"^\d{3,4}$", next_line):  # 3-4 digit flight number
+                elif _is_bare_flight_number(next_line):  # 3-4 digit flight number
                     # Verify line after that is a route (with optional suffix like (C))
-                    if i + 2 < len(lines) and re.match(
-                        r"^[A-Z]{3}-[A-Z]{3}(\([A-Z]\))?$", lines[i + 2].strip()
-                    ):
+                    if i + 2 < num_lines and _ROUTE_LINE_RE.match(stripped_lines[i + 2]):
                         is_flight = True
                         day_info = line
                         flight_num = next_line
                         data_start_offset = 2  # Route starts at i+2
 
             # Case 2: Flight number without day pattern (continuation flight)
-            elif not has_day_pattern and re.match(r"^(UPS|GT|DH)", line, re.IGNORECASE):
+            elif not has_day_pattern and _has_carrier_prefix(line):
                 # Verify next line is a route (with optional suffix like (C))
-                if i + 1 < len(lines) and re.match(
-                    r"^[A-Z]{3}-[A-Z]{3}(\([A-Z]\))?$", lines[i + 1].strip()
-                ):
+                if i + 1 < num_lines and _ROUTE_LINE_RE.match(stripped_lines[i + 1]):
                     is_flight = True
                     day_info = None
                     flight_num = line
                     data_start_offset = 1  # Route starts at i+1
 
             # Case 3: MD-11 format - Bare numeric flight number (3-4 digits)
-            elif not has_day_pattern and re.match(r"^\d{3,4}$", line):
+            elif not has_day_pattern and _is_bare_flight_number(line):
                 # Verify next line is a route (with optional suffix like (C))
-                if i + 1 < len(lines) and re.match(
-                    r"^[A-Z]{3}-[A-Z]{3}(\([A-Z]\))?$", lines[i + 1].strip()
-                ):
+                if i + 1 < num_lines and _ROUTE_LINE_RE.match(stripped_lines[i + 1]):
                     is_flight = True
                     day_info = None
                     flight_num = line
@@ -927,40 +1347,38 @@ def parse_trip_for_table(trip_text, is_edw_func):
                     # Pattern: "1 (Su)Su UPS5969 ONT-SDF (06)14:30 (13)18:10 3h40 76P 1h48 1/1/0 Block 6h19 ..."
 
                     # Extract day pattern (everything before flight number)
-                    day_match = re.match(r"^(\d+\s+\([^)]*\)\S*)", line)
+                    day_match = _DAY_RE.match(line)
                     if day_match:
                         flight_data["day"] = day_match.group(1)
 
                     # Extract flight number
-                    flight_match = re.search(r"((?:UPS|GT|DH)\s*\S+)", line, re.IGNORECASE)
+                    flight_match = _FLIGHT_NUMBER_RE.search(line)
                     if flight_match:
                         flight_data["flight"] = flight_match.group(1)
 
                     # Extract route
-                    route_match = re.search(r"([A-Z]{3}-[A-Z]{3})", line)
+                    route_match = _ROUTE_RE.search(line)
                     if route_match:
                         flight_data["route"] = route_match.group(1)
 
                     # Extract times (depart and arrive)
-                    time_matches = re.findall(r"\((\d+)\)(\d{2}:\d{2})", line)
+                    time_matches = _PAREN_TIME_RE.findall(line)
                     if len(time_matches) >= 1:
                         flight_data["depart"] = f"({time_matches[0][0]}){time_matches[0][1]}"
                     if len(time_matches) >= 2:
                         flight_data["arrive"] = f"({time_matches[1][0]}){time_matches[1][1]}"
 
                     # Extract block time (first time duration after times)
-                    block_match = re.search(r"(\d+h\d+)", line)
-                    if block_match:
-                        flight_data["block"] = block_match.group(1)
-
-                    # Extract connection time (second time duration)
-                    conn_matches = re.findall(r"(\d+h\d+)", line)
-                    if len(conn_matches) >= 2:
-                        flight_data["connection"] = conn_matches[1]
+                    # and connection time (second time duration) from one scan
+                    durations = _DURATION_RE.findall(line)
+                    if len(durations) >= 1:
+                        flight_data["block"] = durations[0]
+                    if len(durations) >= 2:
+                        flight_data["connection"] = durations[1]
 
                     # Extract Block subtotal if present (duty day total)
                     # Pattern: "... Block 6h19 ..."
-                    block_total_match = re.search(r"\bBlock\s+(\d+h\d+)", line)
+                    block_total_match = _INLINE_BLOCK_TIME_RE.search(line)
                     if block_total_match and not current_duty["block_total"]:
                         current_duty["block_total"] = block_total_match.group(1)
 
@@ -968,7 +1386,7 @@ def parse_trip_for_table(trip_text, is_edw_func):
                     # Pattern: "... Credit 6h32L ..."
                     # BUT NOT "Credit Time:" (that's trip summary)
                     if not current_duty["credit"] and "Credit Time:" not in line:
-                        credit_match = re.search(r"\bCredit\s+(\S+)", line)
+                        credit_match = _INLINE_CREDIT_VALUE_RE.search(line)
                         if credit_match:
                             current_duty["credit"] = credit_match.group(1)
 
@@ -985,11 +1403,9 @@ def parse_trip_for_table(trip_text, is_edw_func):
                     offset = data_start_offset
 
                     # Route (required, may have suffix like (C))
-                    if i + offset < len(lines):
-                        potential_route = lines[i + offset].strip()
-                        route_match = re.match(
-                            r"^([A-Z]{3}-[A-Z]{3})(\([A-Z]\))?$", potential_route
-                        )
+                    if i + offset < num_lines:
+                        potential_route = stripped_lines[i + offset]
+                        route_match = _ROUTE_LINE_RE.match(potential_route)
                         if route_match:
                             flight_data["route"] = route_match.group(
                                 1
@@ -997,48 +1413,48 @@ def parse_trip_for_table(trip_text, is_edw_func):
                             offset += 1
 
                     # Depart time
-                    if i + offset < len(lines):
-                        potential_depart = lines[i + offset].strip()
-                        if re.match(r"\(\d+\)\d{2}:\d{2}", potential_depart):
+                    if i + offset < num_lines:
+                        potential_depart = stripped_lines[i + offset]
+                        if _has_paren_time_prefix(potential_depart):
                             flight_data["depart"] = potential_depart
                             offset += 1
 
                     # Arrive time
-                    if i + offset < len(lines):
-                        potential_arrive = lines[i + offset].strip()
-                        if re.match(r"\(\d+\)\d{2}:\d{2}", potential_arrive):
+                    if i + offset < num_lines:
+                        potential_arrive = stripped_lines[i + offset]
+                        if _has_paren_time_prefix(potential_arrive):
                             flight_data["arrive"] = potential_arrive
                             offset += 1
 
                     # Block time
-                    if i + offset < len(lines):
-                        potential_block = lines[i + offset].strip()
-                        if re.match(r"\d+h\d+", potential_block):
+                    if i + offset < num_lines:
+                        potential_block = stripped_lines[i + offset]
+                        if _has_duration_prefix(potential_block):
                             flight_data["block"] = potential_block
                             offset += 1
 
                     # Aircraft type (skip if present - we don't store it)
                     # It's usually 2-3 characters like "75P", "76P", "76M"
-                    if i + offset < len(lines):
-                        potential_aircraft = lines[i + offset].strip()
-                        if re.match(r"^[0-9]{2}[A-Z]$", potential_aircraft):
+                    if i + offset < num_lines:
+                        potential_aircraft = stripped_lines[i + offset]
+                        if _is_aircraft_type(potential_aircraft):
                             offset += 1
 
                     # Connection time (look ahead a bit if needed)
                     max_look_ahead = 3
                     for look in range(max_look_ahead):
-                        if i + offset + look >= len(lines):
+                        if i + offset + look >= num_lines:
                             break
-                        potential_conn = lines[i + offset + look].strip()
-                        if re.match(r"^\d+h\d+$", potential_conn):
+                        potential_conn = stripped_lines[i + offset + look]
+                        if _is_duration(potential_conn):
                             flight_data["connection"] = potential_conn
                             offset += look + 1
                             break
 
                     # Crew needs field (usually "1/1/0" format) - skip if present
-                    if i + offset < len(lines):
-                        potential_crew = lines[i + offset].strip()
-                        if re.match(r"^\d+/\d+/\d+$", potential_crew):
+                    if i + offset < num_lines:
+                        potential_crew = stripped_lines[i + offset]
+                        if _is_crew_need(potential_crew):
                             offset += 1
 
                     current_duty["flights"].append(flight_data)
@@ -1052,9 +1468,9 @@ def parse_trip_for_table(trip_text, is_edw_func):
             # These use exact label matching, safe regardless of structure
 
             # Duty time
-            if line == "Duty" and i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
-                if re.match(r"\d+h\d+", next_line):
+            if line == "Duty" and i + 1 < num_lines:
+                next_line = stripped_lines[i + 1]
+                if _has_duration_prefix(next_line):
                     current_duty["duty_time"] = next_line
 
             # Block total
@@ -1062,34 +1478,33 @@ def parse_trip_for_table(trip_text, is_edw_func):
             # 1. Block on its own line: "Block" followed by "4h50"
             # 2. Block embedded in flight line: "... Block 4h53 ..."
             if not current_duty["block_total"]:
-                if line == "Block" and i + 1 < len(lines):
-                    next_line = lines[i + 1].strip()
-                    if re.match(r"\d+h\d+", next_line):
+                if line == "Block" and i + 1 < num_lines:
+                    next_line = stripped_lines[i + 1]
+                    if _has_duration_prefix(next_line):
                         current_duty["block_total"] = next_line
-                else:
+                elif "Block" in line:
                     # Try to extract Block from within the line
-                    block_match = re.search(r"\bBlock\s+(\d+h\d+)", line)
+                    block_match = _INLINE_BLOCK_TIME_RE.search(line)
                     if block_match:
                         current_duty["block_total"] = block_match.group(1)
 
             # Credit
             # Handle both standalone "Credit" line and embedded "Credit XXX" pattern
             if not current_duty["credit"]:
-                if line == "Credit" and i + 1 < len(lines):
-                    next_line = lines[i + 1].strip()
+                if line == "Credit" and i + 1 < num_lines:
+                    next_line = stripped_lines[i + 1]
                     if next_line and next_line != "-":
                         current_duty["credit"] = next_line
-                else:
+                elif "Credit" in line and "Credit Time:" not in line:
                     # Try to extract Credit from within the line
                     # But NOT if it's "Credit Time:" (that's trip summary)
-                    if "Credit Time:" not in line:
-                        credit_match = re.search(r"\bCredit\s+(\S+)", line)
-                        if credit_match:
-                            current_duty["credit"] = credit_match.group(1)
+                    credit_match = _INLINE_CREDIT_VALUE_RE.search(line)
+                    if credit_match:
+                        current_duty["credit"] = credit_match.group(1)
 
             # Rest/Layover
-            if line == "Rest" and i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
+            if line == "Rest" and i + 1 < num_lines:
+                next_line = stripped_lines[i + 1]
                 if next_line and next_line != "-":
                     current_duty["rest"] = next_line
 
@@ -1103,93 +1518,97 @@ def parse_trip_for_table(trip_text, is_edw_func):
     # Handles both formats:
     # - Multi-line: Label on one line, value on next
     # - Single-line: Label and value on same line (e.g., "Credit Time: 6h00M")
+    # The summary block sits at the end of the trip and the last occurrence of each
+    # label wins, so walk backwards and stop once every field has been filled.
     trip_summary = {}
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
+    for i in range(num_lines - 1, -1, -1):
+        line = stripped_lines[i]
+        # Position of the first occurrence of each still-missing label on this line
+        labels = {}
+        for match in _TRIP_SUMMARY_LABEL_RE.finditer(line):
+            if _TRIP_SUMMARY_KEYS[match.lastgroup] not in trip_summary:
+                labels.setdefault(match.lastgroup, match.start())
+        if not labels:
+            continue
+        next_line = stripped_lines[i + 1] if i + 1 < num_lines else None
 
         # Try to extract value from same line first (single-line format)
         # Then fall back to next line (multi-line format)
 
         # Credit Time
-        if "Credit Time:" in line:
-            match = re.search(r"Credit Time:\s*(\S+)", line)
+        if "credit" in labels:
+            match = _CREDIT_TIME_RE.match(line, labels["credit"])
             if match:
                 trip_summary["Credit"] = match.group(1)
-            elif i + 1 < len(lines):
-                trip_summary["Credit"] = lines[i + 1].strip()
+            elif next_line is not None:
+                trip_summary["Credit"] = next_line
 
         # Block Time
-        if "Block Time:" in line:
-            match = re.search(r"Block Time:\s*(\S+)", line)
+        if "block" in labels:
+            match = _BLOCK_TIME_RE.match(line, labels["block"])
             if match:
                 trip_summary["Blk"] = match.group(1)
-            elif i + 1 < len(lines):
-                trip_summary["Blk"] = lines[i + 1].strip()
+            elif next_line is not None:
+                trip_summary["Blk"] = next_line
 
         # Duty Time (trip summary, not duty day summary)
-        if "Duty Time:" in line and "Summary" not in lines[max(0, i - 5) : i + 1]:
-            match = re.search(r"Duty Time:\s*(\S+)", line)
+        if "duty" in labels and "Summary" not in lines[max(0, i - 5) : i + 1]:
+            match = _DUTY_TIME_RE.match(line, labels["duty"])
             if match:
                 trip_summary["Duty Time"] = match.group(1)
-            elif i + 1 < len(lines):
-                trip_summary["Duty Time"] = lines[i + 1].strip()
+            elif next_line is not None:
+                trip_summary["Duty Time"] = next_line
 
         # TAFB
-        if "TAFB:" in line:
-            match = re.search(r"TAFB:\s*(\S+)", line)
+        if "tafb" in labels:
+            match = _TAFB_VALUE_RE.match(line, labels["tafb"])
             if match:
                 trip_summary["TAFB"] = match.group(1)
-            elif i + 1 < len(lines):
-                trip_summary["TAFB"] = lines[i + 1].strip()
+            elif next_line is not None:
+                trip_summary["TAFB"] = next_line
 
         # Premium (handles both "Premium:" and "Premium" formats)
-        if "Premium" in line:
-            match = re.search(r"Premium:?\s*(\S+)", line)
+        if "premium" in labels:
+            match = _PREMIUM_RE.match(line, labels["premium"])
             if match and match.group(1) not in ["", "Premium"]:
                 trip_summary["Prem"] = match.group(1)
-            elif i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
+            elif next_line and not next_line[0].isalpha():
                 # Value is on next line
-                if next_line and not next_line[0].isalpha():
-                    trip_summary["Prem"] = next_line
+                trip_summary["Prem"] = next_line
 
         # Per Diem (handles both "per Diem:" and "per Diem" formats, case insensitive)
-        if re.search(r"per\s+Diem", line, re.IGNORECASE):
-            match = re.search(r"per\s+Diem:?\s*(\S+)", line, re.IGNORECASE)
+        if "per_diem" in labels:
+            match = _PER_DIEM_RE.match(line, labels["per_diem"])
             if match and match.group(1) not in ["", "Diem"]:
                 trip_summary["PDiem"] = match.group(1)
-            elif i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
+            elif next_line and not next_line[0].isalpha():
                 # Value is on next line
-                if next_line and not next_line[0].isalpha():
-                    trip_summary["PDiem"] = next_line
+                trip_summary["PDiem"] = next_line
 
-        # LDGS
-        if "LDGS" in line:
-            match = re.search(r"LDGS\s+(\d+)", line)
+        # LDGS (the count may follow a later "LDGS" on the same line)
+        if "ldgs" in labels:
+            match = _LDGS_RE.search(line, labels["ldgs"])
             if match:
                 trip_summary["LDGS"] = match.group(1)
-            elif i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
-                if next_line.isdigit():
-                    trip_summary["LDGS"] = next_line
+            elif next_line is not None and next_line.isdigit():
+                trip_summary["LDGS"] = next_line
 
         # Domicile
-        if "Domicile:" in line:
-            match = re.search(r"Domicile:\s*(\S+)", line)
+        if "domicile" in labels:
+            match = _DOMICILE_RE.match(line, labels["domicile"])
             if match:
                 trip_summary["Domicile"] = match.group(1)
-            elif i + 1 < len(lines):
-                trip_summary["Domicile"] = lines[i + 1].strip()
+            elif next_line is not None:
+                trip_summary["Domicile"] = next_line
 
         # Crew has value on same line
-        if "Crew:" in line:
-            match = re.search(r"Crew:\s*(\S+)", line)
+        if "crew" in labels:
+            match = _CREW_RE.match(line, labels["crew"])
             if match:
                 trip_summary["Crew"] = match.group(1)
 
-        i += 1
+        if len(trip_summary) == len(_TRIP_SUMMARY_KEYS):
+            break
 
     # Count duty days
     trip_summary["Duty Days"] = str(len(duty_days))
@@ -1206,136 +1625,37 @@ def format_trip_details(trip_text):
     """
     Parse and format trip text into structured data for display.
 
+    Legacy view of parse_trip_for_table: the same parse (and its cache), with
+    the original format_trip_details key names.
+
     Args:
         trip_text: Raw trip text
 
     Returns:
         Dictionary with formatted sections including duty days
     """
-    lines = trip_text.split("\n")
-
-    # Extract header info
-    trip_id = parse_trip_id(trip_text)
-
-    # Find date/frequency line
-    date_freq = None
-    for line in lines:
-        if re.search(r"\d+\s+trips?\)", line, re.IGNORECASE):
-            date_freq = line.strip()
-            break
-
-    # Parse duty days - track sections between Briefing and Debriefing
-    duty_days = []
-    current_duty = None
-    current_flight = None
-
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-
-        # Start of duty day
-        if re.search(r"\bBriefing\b", line, re.IGNORECASE):
-            if current_duty:
-                duty_days.append(current_duty)
-            current_duty = {
-                "briefing": None,
-                "debriefing": None,
-                "flights": [],
-                "duty_time": None,
-                "block_time": None,
-                "credit": None,
-                "rest": None,
-            }
-            # Next line should have briefing time
-            if i + 1 < len(lines):
-                current_duty["briefing"] = lines[i + 1].strip()
-
-        # Flight number
-        elif current_duty and re.match(r"^UPS\s*\d+$", line, re.IGNORECASE):
-            current_flight = {"flight": line}
-            current_duty["flights"].append(current_flight)
-
-        # Route (XXX-XXX)
-        elif current_flight and re.match(r"^[A-Z]{3}-[A-Z]{3}$", line):
-            current_flight["route"] = line
-            # Look ahead for start time, end time, block time, aircraft
-            if i + 1 < len(lines):
-                current_flight["start"] = lines[i + 1].strip()
-            if i + 2 < len(lines):
-                current_flight["end"] = lines[i + 2].strip()
-            if i + 3 < len(lines):
-                current_flight["block"] = lines[i + 3].strip()
-            if i + 4 < len(lines):
-                current_flight["aircraft"] = lines[i + 4].strip()
-            if i + 5 < len(lines):
-                current_flight["connection"] = lines[i + 5].strip()
-
-        # Debriefing
-        elif current_duty and re.search(r"\bDebriefing\b", line, re.IGNORECASE):
-            if i + 1 < len(lines):
-                current_duty["debriefing"] = lines[i + 1].strip()
-
-        # Duty time
-        elif current_duty and re.search(r"Duty\s+(\d+h\d+)", line, re.IGNORECASE):
-            match = re.search(r"Duty\s+(\d+h\d+)", line, re.IGNORECASE)
-            current_duty["duty_time"] = match.group(1)
-
-        # Block time (in duty summary)
-        elif current_duty and re.search(r"Block\s+(\d+h\d+)", line, re.IGNORECASE):
-            match = re.search(r"Block\s+(\d+h\d+)", line, re.IGNORECASE)
-            if not current_duty["block_time"]:
-                current_duty["block_time"] = match.group(1)
-
-        # Credit
-        elif current_duty and re.search(r"Credit\s+(\S+)", line, re.IGNORECASE):
-            match = re.search(r"Credit\s+(\S+)", line, re.IGNORECASE)
-            current_duty["credit"] = match.group(1)
-
-        # Rest period
-        elif current_duty and re.search(r"Rest\s+(\S+)", line, re.IGNORECASE):
-            match = re.search(r"Rest\s+(.+)", line, re.IGNORECASE)
-            current_duty["rest"] = match.group(1).strip()
-
-        i += 1
-
-    if current_duty:
-        duty_days.append(current_duty)
-
-    # Extract trip-level summary
-    trip_summary = {}
-    for line in lines:
-        if "TAFB:" in line:
-            match = re.search(r"TAFB:\s*(\S+)", line)
-            if match:
-                trip_summary["TAFB"] = match.group(1)
-        if "Credit Time:" in line:
-            match = re.search(r"Credit Time:\s*(\S+)", line)
-            if match:
-                trip_summary["Credit Time"] = match.group(1)
-        if "Block Time:" in line and "Block Time:" not in [k for k in trip_summary.keys()]:
-            match = re.search(r"Block Time:\s*(\S+)", line)
-            if match:
-                trip_summary["Block Time"] = match.group(1)
-        if "Duty Time:" in line:
-            match = re.search(r"Duty Time:\s*(\S+)", line)
-            if match:
-                trip_summary["Duty Time"] = match.group(1)
-        if "Premium:" in line:
-            match = re.search(r"Premium:\s*(\S+)", line)
-            if match:
-                trip_summary["Premium"] = match.group(1)
-        if "per Diem:" in line or "Per Diem:" in line:
-            match = re.search(r"[Pp]er [Dd]iem:\s*(\S+)", line)
-            if match:
-                trip_summary["Per Diem"] = match.group(1)
-        if "LDGS" in line:
-            match = re.search(r"LDGS\s+(\d+)", line)
-            if match:
-                trip_summary["Landings"] = match.group(1)
+    table = _parse_trip_for_table_cached(trip_text)
+    summary = table["trip_summary"]
 
     return {
-        "trip_id": trip_id,
-        "date_freq": date_freq,
-        "duty_days": duty_days,
-        "trip_summary": trip_summary,
+        "trip_id": table["trip_id"],
+        "date_freq": table["date_freq"],
+        "duty_days": [
+            {
+                "briefing": duty["duty_start"],
+                "debriefing": duty["duty_end"],
+                "flights": [
+                    {legacy: flight[key] for key, legacy in _LEGACY_FLIGHT_KEYS.items()}
+                    for flight in duty["flights"]
+                ],
+                "duty_time": duty["duty_time"],
+                "block_time": duty["block_total"],
+                "credit": duty["credit"],
+                "rest": duty["rest"],
+            }
+            for duty in table["duty_days"]
+        ],
+        "trip_summary": {
+            legacy: summary[key] for key, legacy in _LEGACY_SUMMARY_KEYS.items() if key in summary
+        },
     }
@@ -12,22 +12,40 @@ from pathlib import Path
 
 import pandas as pd
 
-# Import PDF generation from centralized module
-from pdf_generation import create_edw_pdf_report
-
 from .analyzer import is_edw_trip, is_hot_standby
 from .excel_export import build_edw_dataframes, save_edw_excel
 from .parser import (
+    _pool_workers,
+    _process_pool,
+    clear_trip_caches,
     parse_duty_day_details,
-    parse_duty_days,
-    parse_max_duty_day_length,
     parse_max_legs_per_duty_day,
     parse_pairings,
-    parse_tafb,
-    parse_trip_frequency,
-    parse_trip_id,
+    parse_trip_metrics,
 )
 
+# When worker processes are enabled (EDW_PARSE_WORKERS, see parser), trips are
+# analyzed in parallel only for packets at least this large; for smaller ones
+# process start-up costs more than the parsing it offloads
+_PARALLEL_MIN_TRIPS = 500
+_MAX_ANALYSIS_WORKERS = 8
+# Trips handed to a worker per task, to amortize pickling texts and records
+_ANALYSIS_CHUNK_TRIPS = 16
+
+# df_trips columns, in the order of the record tuples built by _analyze_trip
+_TRIP_RECORD_COLUMNS = [
+    "Trip ID",
+    "Frequency",
+    "Hot Standby",
+    "TAFB Hours",
+    "TAFB Days",
+    "Duty Days",
+    "Max Duty Length",
+    "Max Legs/Duty",
+    "EDW",
+    "Duty Day Details",
+]
+
 
 # -------------------------------------------------------------------
 # Main Reporting Function
@@ -39,6 +57,7 @@ def run_edw_report(
     aircraft: str,
     bid_period: str,
     progress_callback=None,
+    trips=None,
 ):
     """
     Generate comprehensive EDW report from pairing PDF.
@@ -58,6 +77,8 @@ def run_edw_report(
         aircraft: Fleet type (e.g., "757", "MD-11")
         bid_period: Bid period identifier (e.g., "2507")
         progress_callback: Optional callback function(progress, message) to report progress (0-100)
+        trips: Optional trip texts already extracted from pdf_path by parse_pairings
+            (e.g. cached by the caller); the PDF is parsed here when omitted
 
     Returns:
         Dictionary with:
@@ -77,7 +98,9 @@ def run_edw_report(
     if progress_callback:
         progress_callback(5, "Starting PDF parsing...")
 
-    trips = parse_pairings(pdf_path, progress_callback=progress_callback)
+    clear_trip_caches()
+    if trips is None:
+        trips = parse_pairings(pdf_path, progress_callback=progress_callback)
 
     if progress_callback:
         progress_callback(45, f"Analyzing {len(trips)} pairings...")
@@ -85,34 +108,11 @@ def run_edw_report(
     trip_records = []
     trip_text_map = {}  # Map Trip ID to raw trip text
     total_trips = len(trips)
-    for idx, trip_text in enumerate(trips, start=1):
-        trip_id = parse_trip_id(trip_text)
-        frequency = parse_trip_frequency(trip_text)
-        hot_standby = is_hot_standby(trip_text)
-        edw_flag = is_edw_trip(trip_text)
-        tafb_hours = parse_tafb(trip_text)
-        tafb_days = tafb_hours / 24.0 if tafb_hours else 0.0
-        duty_days = parse_duty_days(trip_text)
-        max_duty_length = parse_max_duty_day_length(trip_text)
-        max_legs = parse_max_legs_per_duty_day(trip_text)
-        duty_day_details = parse_duty_day_details(trip_text, is_edw_trip)
-
-        trip_records.append(
-            {
-                "Trip ID": trip_id,
-                "Frequency": frequency,
-                "Hot Standby": hot_standby,
-                "TAFB Hours": round(tafb_hours, 2),
-                "TAFB Days": round(tafb_days, 2),
-                "Duty Days": duty_days,
-                "Max Duty Length": round(max_duty_length, 2),
-                "Max Legs/Duty": max_legs,
-                "EDW": edw_flag,
-                "Duty Day Details": duty_day_details,  # Store list of duty day info
-            }
-        )
+    for idx, (trip_text, record) in enumerate(zip(trips, _iter_trip_records(trips)), start=1):
+        trip_records.append(record)
 
         # Store raw trip text indexed by Trip ID
+        trip_id = record[0]
         if trip_id is not None:
             trip_text_map[trip_id] = trip_text
 
@@ -121,7 +121,7 @@ def run_edw_report(
             progress = int(45 + (idx / total_trips) * 10)  # 45% to 55%
             progress_callback(progress, f"Analyzing pairings... ({idx}/{total_trips})")
 
-    df_trips = pd.DataFrame(trip_records)
+    df_trips = pd.DataFrame.from_records(trip_records, columns=_TRIP_RECORD_COLUMNS)
 
     # Handle empty or malformed dataframe
     if df_trips.empty:
@@ -134,9 +134,6 @@ def run_edw_report(
             "**Expected format:** Pairing PDF with Trip IDs and duty day information"
         )
 
-    if "Hot Standby" not in df_trips.columns:
-        raise ValueError("No valid trips parsed from PDF. Please check PDF format.")
-
     if progress_callback:
         progress_callback(60, "Calculating statistics...")
 
@@ -167,21 +164,25 @@ def run_edw_report(
         progress_callback(70, "Creating PDF report...")
 
     # -------------------- PDF Report Generation --------------------
+    # Imported here: ReportLab and Matplotlib dominate the import time of this
+    # package, and parser-only users (trip viewer, analysis workers) never need them
+    from pdf_generation import create_edw_pdf_report
+
     # Prepare data for PDF generation module
     pdf_report_path = output_dir / f"{domicile}_{aircraft}_Bid{bid_period}_EDW_Report.pdf"
 
     # Convert DataFrames to formats expected by create_edw_pdf_report
-    trip_summary_dict = {row["Metric"]: row["Value"] for _, row in trip_summary.iterrows()}
+    trip_summary_dict = dict(zip(trip_summary["Metric"], trip_summary["Value"]))
 
-    weighted_summary_dict = {row["Metric"]: row["Value"] for _, row in weighted_summary.iterrows()}
+    weighted_summary_dict = dict(zip(weighted_summary["Metric"], weighted_summary["Value"]))
 
     # Convert duty_day_stats DataFrame to list of lists
     duty_day_stats_list = [list(duty_day_stats.columns)] + duty_day_stats.values.tolist()
 
     # Convert duty_dist DataFrame to list of dicts for charts
     trip_length_dist = [
-        {"duty_days": int(row["Duty Days"]), "trips": int(row["Trips"])}
-        for _, row in duty_dist.iterrows()
+        {"duty_days": int(duty_days), "trips": int(trips)}
+        for duty_days, trips in zip(duty_dist["Duty Days"], duty_dist["Trips"])
     ]
 
     # Build report data dictionary
@@ -213,3 +214,55 @@ def run_edw_report(
         "hot_standby_summary": hot_standby_summary,
         "trip_text_map": trip_text_map,
     }
+
+
+# -------------------------------------------------------------------
+# Per-Trip Analysis
+# -------------------------------------------------------------------
+def _iter_trip_records(trips):
+    """
+    Yield the analysis record of each trip, in the order given.
+
+    Every trip is analyzed independently, so when worker processes are enabled
+    (EDW_PARSE_WORKERS) large packets are spread across them (the parsers are
+    pure Python, so threads would serialize on the GIL).
+
+    Args:
+        trips: List of raw trip text strings
+
+    Yields:
+        Trip record tuples (see _analyze_trip)
+    """
+    workers = _pool_workers(_MAX_ANALYSIS_WORKERS)
+
+    if workers > 1 and len(trips) >= _PARALLEL_MIN_TRIPS:
+        with _process_pool(workers) as executor:
+            yield from executor.map(_analyze_trip, trips, chunksize=_ANALYSIS_CHUNK_TRIPS)
+    else:
+        for trip_text in trips:
+            yield _analyze_trip(trip_text)
+
+
+def _analyze_trip(trip_text):
+    """
+    Build the trip record for one pairing - may run in a worker process.
+
+    Records are plain tuples in _TRIP_RECORD_COLUMNS order: cheaper to build
+    and to pickle back from a worker than one dict per trip.
+    """
+    metrics = parse_trip_metrics(trip_text)
+    tafb_hours = metrics["tafb_hours"]
+    tafb_days = tafb_hours / 24.0 if tafb_hours else 0.0
+
+    return (
+        metrics["trip_id"],
+        metrics["frequency"],
+        is_hot_standby(trip_text),
+        round(tafb_hours, 2),
+        round(tafb_days, 2),
+        metrics["duty_days"],
+        round(metrics["max_duty_length"], 2),
+        parse_max_legs_per_duty_day(trip_text),
+        is_edw_trip(trip_text),
+        parse_duty_day_details(trip_text, is_edw_trip),  # List of duty day info
+    )
@@ -18,11 +18,12 @@ def find_heading(pdf_path: str):
     print("=" * 80)
 
     reader = PdfReader(str(pdf_path))
-    all_text = ""
+    parts = []
 
     print(f"Reading {len(reader.pages)} pages...")
     for page in reader.pages:
-        all_text += page.extract_text() + "\n"
+        parts.append(page.extract_text())
+    all_text = "\n".join(parts) + "\n"
 
     print(f"\nSearching for lines containing 'trip', 'flight', and 'report'...\n")
 
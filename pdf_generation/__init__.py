@@ -30,6 +30,7 @@ from .base import (
     draw_footer,
     draw_header,
     hex_to_reportlab_color,
+    make_chart_row,
     make_kpi_row,
     make_styled_table,
 )
@@ -66,6 +67,7 @@ __all__ = [
     "KPIBadge",
     "make_kpi_row",
     "make_styled_table",
+    "make_chart_row",
     # Chart functions
     "save_bar_chart",
     "save_percentage_bar_chart",
@@ -7,11 +7,12 @@ Contains:
 - Color conversion utilities
 - Header and footer rendering
 - KPI badge flowables
-- Common table styling
+- Common table styling and chart rows
 """
 
 import os
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List
 
 # ReportLab imports
@@ -32,10 +33,30 @@ DEFAULT_BRANDING = {
 }
 
 
+# Layout styles shared by every KPI / chart row. setStyle only reads the
+# commands, so one TableStyle instance serves all the tables
+_KPI_ROW_STYLE = TableStyle(
+    [
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+    ]
+)
+_CHART_ROW_STYLE = TableStyle(
+    [
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+    ]
+)
+
+
+@lru_cache(maxsize=32)
 def hex_to_reportlab_color(hex_str: str) -> colors.Color:
     """
     Convert hex color string to ReportLab Color object.
 
+    Cached because every table and page header re-converts the same few
+    brand colors; callers must not modify the returned Color.
+
     Args:
         hex_str: Hex color string (e.g., "#1BB3A4" or "1BB3A4")
 
@@ -212,15 +233,24 @@ def make_kpi_row(metrics: Dict[str, Any], branding: Dict[str, Any]) -> Table:
     # Create table to hold badges
     table_data = [[badge for badge in badges]]
     table = Table(table_data, colWidths=[130] * len(badges))
-    table.setStyle(
-        TableStyle(
-            [
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-            ]
-        )
-    )
+    table.setStyle(_KPI_ROW_STYLE)
+
+    return table
+
 
+def make_chart_row(images: List[Flowable], col_widths: List[float]) -> Table:
+    """
+    Place chart images side by side in a borderless one-row table.
+
+    Args:
+        images: Chart flowables (usually ReportLab Images), left to right
+        col_widths: List of column widths in points, one per image
+
+    Returns:
+        ReportLab Table with each chart top-aligned and centered in its column
+    """
+    table = Table([images], colWidths=col_widths)
+    table.setStyle(_CHART_ROW_STYLE)
     return table
 
 
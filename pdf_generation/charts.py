@@ -8,15 +8,22 @@ Contains:
 - Bid line-specific charts (distributions, buy-up analysis)
 """
 
-import tempfile
+from io import BytesIO
 from typing import Dict, List, Optional
 
-import matplotlib
-import pandas as pd
-
-matplotlib.use("Agg")  # Non-interactive backend
-import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
+
+# ReportLab decodes chart PNGs again when embedding them, so their size doesn't
+# matter: the fastest zlib level saves encode time on every chart
+_PNG_SAVE_OPTIONS = {"compress_level": 1}
+# Most charts are drawn on 5-7 in figures but placed in 2-4 in boxes on the page,
+# so 100 dpi still gives them at least ~130 dpi at their printed size
+_PNG_DPI = 100
+# The EDW percentages comparison chart is printed 5 in wide from a 6 in figure;
+# it keeps the original 150 dpi (~180 dpi on the page)
+_PNG_DPI_LARGE = 150
 
 # ============================================================================
 # GENERIC CHART FUNCTIONS
@@ -31,9 +38,9 @@ def save_bar_chart(
     xlabel: str,
     ylabel: str,
     color: str = "#3B82F6",
-) -> Optional[str]:
+) -> Optional[BytesIO]:
     """
-    Create and save a generic bar chart to temp file.
+    Create a generic bar chart as an in-memory PNG.
 
     Args:
         data: DataFrame with category and value columns
@@ -45,12 +52,13 @@ def save_bar_chart(
         color: Bar color (hex string)
 
     Returns:
-        Path to temp PNG file, or None if data is empty
+        In-memory PNG image, or None if data is empty
     """
     if data.empty:
         return None
 
-    fig, ax = plt.subplots(figsize=(6, 4))
+    fig = Figure(figsize=(6, 4))
+    ax = fig.subplots()
 
     labels = data[category_key].astype(str).tolist()
     values = data[value_key].astype(float).tolist()
@@ -77,16 +85,17 @@ def save_bar_chart(
 
     # Rotate x-axis labels if many categories
     if len(labels) > 6:
-        plt.xticks(rotation=45, ha="right")
+        for label in ax.get_xticklabels():
+            label.set(rotation=45, ha="right")
 
-    plt.tight_layout()
+    fig.tight_layout()
 
-    # Save to temp file
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-    plt.savefig(temp_file.name, dpi=150, bbox_inches="tight")
-    plt.close(fig)
+    # Render to an in-memory PNG
+    buf = BytesIO()
+    fig.savefig(buf, format="png", dpi=_PNG_DPI, pil_kwargs=_PNG_SAVE_OPTIONS)
+    buf.seek(0)
 
-    return temp_file.name
+    return buf
 
 
 def save_percentage_bar_chart(
@@ -96,9 +105,9 @@ def save_percentage_bar_chart(
     percent_key: str,
     xlabel: str,
     color: str = "#3B82F6",
-) -> Optional[str]:
+) -> Optional[BytesIO]:
     """
-    Create and save a percentage bar chart to temp file.
+    Create a percentage bar chart as an in-memory PNG.
 
     Args:
         data: DataFrame with category and percentage columns
@@ -109,12 +118,13 @@ def save_percentage_bar_chart(
         color: Bar color (hex string)
 
     Returns:
-        Path to temp PNG file, or None if data is empty
+        In-memory PNG image, or None if data is empty
     """
     if data.empty:
         return None
 
-    fig, ax = plt.subplots(figsize=(6, 4))
+    fig = Figure(figsize=(6, 4))
+    ax = fig.subplots()
 
     labels = data[category_key].astype(str).tolist()
     # Extract percentage values (remove % sign if present and convert to float)
@@ -144,23 +154,24 @@ def save_percentage_bar_chart(
 
     # Rotate x-axis labels if many categories
     if len(labels) > 6:
-        plt.xticks(rotation=45, ha="right")
+        for label in ax.get_xticklabels():
+            label.set(rotation=45, ha="right")
 
-    plt.tight_layout()
+    fig.tight_layout()
 
-    # Save to temp file
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-    plt.savefig(temp_file.name, dpi=150, bbox_inches="tight")
-    plt.close(fig)
+    # Render to an in-memory PNG
+    buf = BytesIO()
+    fig.savefig(buf, format="png", dpi=_PNG_DPI, pil_kwargs=_PNG_SAVE_OPTIONS)
+    buf.seek(0)
 
-    return temp_file.name
+    return buf
 
 
 def save_pie_chart(
     title: str, labels: List[str], values: List[int], colors_list: List[str]
-) -> Optional[str]:
+) -> Optional[BytesIO]:
     """
-    Create and save a pie chart to temp file.
+    Create a pie chart as an in-memory PNG.
 
     Args:
         title: Chart title
@@ -169,13 +180,14 @@ def save_pie_chart(
         colors_list: List of hex color strings for slices
 
     Returns:
-        Path to temp PNG file, or None if values are empty
+        In-memory PNG image, or None if values are empty
     """
     if not values or sum(values) == 0:
         return None
 
     # Large square figure for long labels
-    fig, ax = plt.subplots(figsize=(7, 7), dpi=100)
+    fig = Figure(figsize=(7, 7), dpi=100)
+    ax = fig.subplots()
 
     wedges, texts, autotexts = ax.pie(
         values,
@@ -199,14 +211,15 @@ def save_pie_chart(
     ax.axis("equal")  # Ensure perfect circle
 
     # Wide margins to accommodate long labels
-    plt.subplots_adjust(left=0.22, right=0.78, top=0.78, bottom=0.22)
+    fig.subplots_adjust(left=0.22, right=0.78, top=0.78, bottom=0.22)
 
-    # Save to temp file with fixed bbox to maintain square aspect ratio
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-    plt.savefig(temp_file.name, dpi=150, bbox_inches=None)  # Keep square shape
-    plt.close(fig)
+    # Render to an in-memory PNG with fixed bbox to maintain square aspect ratio
+    buf = BytesIO()
+    # Keep square shape
+    fig.savefig(buf, format="png", dpi=_PNG_DPI, pil_kwargs=_PNG_SAVE_OPTIONS, bbox_inches=None)
+    buf.seek(0)
 
-    return temp_file.name
+    return buf
 
 
 # ============================================================================
@@ -214,19 +227,20 @@ def save_pie_chart(
 # ============================================================================
 
 
-def save_edw_pie_chart(edw_trips: int, non_edw_trips: int) -> str:
+def save_edw_pie_chart(edw_trips: int, non_edw_trips: int) -> BytesIO:
     """
-    Create and save EDW vs Non-EDW pie chart to temp file.
+    Create EDW vs Non-EDW pie chart as an in-memory PNG.
 
     Args:
         edw_trips: Number of EDW trips
         non_edw_trips: Number of non-EDW trips
 
     Returns:
-        Path to temp PNG file
+        In-memory PNG image
     """
     # Large square figure for perfect circles with room for labels
-    fig, ax = plt.subplots(figsize=(5, 5), dpi=100)
+    fig = Figure(figsize=(5, 5), dpi=100)
+    ax = fig.subplots()
 
     labels = ["EDW", "Non-EDW"]
     sizes = [edw_trips, non_edw_trips]
@@ -257,30 +271,32 @@ def save_edw_pie_chart(edw_trips: int, non_edw_trips: int) -> str:
     ax.axis("equal")  # Ensure perfect circle
 
     # Adjust subplot to ensure labels fit within square canvas
-    plt.subplots_adjust(left=0.15, right=0.85, top=0.82, bottom=0.15)
+    fig.subplots_adjust(left=0.15, right=0.85, top=0.82, bottom=0.15)
 
-    # Save to temp file with fixed bbox to maintain square aspect ratio
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-    plt.savefig(temp_file.name, dpi=150, bbox_inches=None)  # Keep square shape
-    plt.close(fig)
+    # Render to an in-memory PNG with fixed bbox to maintain square aspect ratio
+    buf = BytesIO()
+    # Keep square shape
+    fig.savefig(buf, format="png", dpi=_PNG_DPI, pil_kwargs=_PNG_SAVE_OPTIONS, bbox_inches=None)
+    buf.seek(0)
 
-    return temp_file.name
+    return buf
 
 
 def save_trip_length_bar_chart(
     trip_length_distribution: List[Dict[str, int]], title: str = "Trip Length Distribution"
-) -> str:
+) -> BytesIO:
     """
-    Create and save trip length distribution bar chart to temp file.
+    Create trip length distribution bar chart as an in-memory PNG.
 
     Args:
         trip_length_distribution: List of dicts with 'duty_days' and 'trips' keys
         title: Chart title
 
     Returns:
-        Path to temp PNG file
+        In-memory PNG image
     """
-    fig, ax = plt.subplots(figsize=(5, 4))
+    fig = Figure(figsize=(5, 4))
+    ax = fig.subplots()
 
     duty_days = [str(item["duty_days"]) for item in trip_length_distribution]
     trips = [item["trips"] for item in trip_length_distribution]
@@ -305,30 +321,31 @@ def save_trip_length_bar_chart(
             fontsize=9,
         )
 
-    plt.tight_layout()
+    fig.tight_layout()
 
-    # Save to temp file
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-    plt.savefig(temp_file.name, dpi=150, bbox_inches="tight")
-    plt.close(fig)
+    # Render to an in-memory PNG
+    buf = BytesIO()
+    fig.savefig(buf, format="png", dpi=_PNG_DPI, pil_kwargs=_PNG_SAVE_OPTIONS)
+    buf.seek(0)
 
-    return temp_file.name
+    return buf
 
 
 def save_trip_length_percentage_bar_chart(
     trip_length_distribution: List[Dict[str, int]], title: str = "Trip Length Distribution (%)"
-) -> str:
+) -> BytesIO:
     """
-    Create and save trip length percentage bar chart to temp file.
+    Create trip length percentage bar chart as an in-memory PNG.
 
     Args:
         trip_length_distribution: List of dicts with 'duty_days' and 'trips' keys
         title: Chart title
 
     Returns:
-        Path to temp PNG file
+        In-memory PNG image
     """
-    fig, ax = plt.subplots(figsize=(5, 4))
+    fig = Figure(figsize=(5, 4))
+    ax = fig.subplots()
 
     duty_days = [str(item["duty_days"]) for item in trip_length_distribution]
     trips = [item["trips"] for item in trip_length_distribution]
@@ -359,27 +376,28 @@ def save_trip_length_percentage_bar_chart(
             weight="bold",
         )
 
-    plt.tight_layout()
+    fig.tight_layout()
 
-    # Save to temp file
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-    plt.savefig(temp_file.name, dpi=150, bbox_inches="tight")
-    plt.close(fig)
+    # Render to an in-memory PNG
+    buf = BytesIO()
+    fig.savefig(buf, format="png", dpi=_PNG_DPI, pil_kwargs=_PNG_SAVE_OPTIONS)
+    buf.seek(0)
 
-    return temp_file.name
+    return buf
 
 
-def save_edw_percentages_comparison_chart(weighted_summary: Dict[str, str]) -> str:
+def save_edw_percentages_comparison_chart(weighted_summary: Dict[str, str]) -> BytesIO:
     """
-    Create and save EDW percentages comparison bar chart to temp file.
+    Create EDW percentages comparison bar chart as an in-memory PNG.
 
     Args:
         weighted_summary: Dict with keys like "Trip-weighted EDW trip %"
 
     Returns:
-        Path to temp PNG file
+        In-memory PNG image
     """
-    fig, ax = plt.subplots(figsize=(6, 4))
+    fig = Figure(figsize=(6, 4))
+    ax = fig.subplots()
 
     # Extract percentages (remove % sign and convert to float)
     methods = ["Trip-Weighted", "TAFB-Weighted", "Duty Day-Weighted"]
@@ -421,22 +439,23 @@ def save_edw_percentages_comparison_chart(weighted_summary: Dict[str, str]) -> s
         )
 
     # Rotate x-axis labels for better readability
-    plt.xticks(rotation=15, ha="right")
-    plt.tight_layout()
+    for label in ax.get_xticklabels():
+        label.set(rotation=15, ha="right")
+    fig.tight_layout()
 
-    # Save to temp file
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-    plt.savefig(temp_file.name, dpi=150, bbox_inches="tight")
-    plt.close(fig)
+    # Render to an in-memory PNG
+    buf = BytesIO()
+    fig.savefig(buf, format="png", dpi=_PNG_DPI_LARGE, pil_kwargs=_PNG_SAVE_OPTIONS)
+    buf.seek(0)
 
-    return temp_file.name
+    return buf
 
 
 def save_weighted_method_pie_chart(
     edw_pct: float, method_name: str, color_scheme: str = "default"
-) -> str:
+) -> BytesIO:
     """
-    Create and save weighted method pie chart to temp file.
+    Create weighted method pie chart as an in-memory PNG.
 
     Args:
         edw_pct: EDW percentage (0-100)
@@ -444,10 +463,11 @@ def save_weighted_method_pie_chart(
         color_scheme: Color scheme ('trip', 'tafb', 'duty', or 'default')
 
     Returns:
-        Path to temp PNG file
+        In-memory PNG image
     """
     # Large square figure for perfect circles with room for labels
-    fig, ax = plt.subplots(figsize=(5, 5), dpi=100)
+    fig = Figure(figsize=(5, 5), dpi=100)
+    ax = fig.subplots()
 
     labels = ["EDW", "Non-EDW"]
     sizes = [edw_pct, 100 - edw_pct]
@@ -485,17 +505,18 @@ def save_weighted_method_pie_chart(
     ax.axis("equal")  # Ensure perfect circle
 
     # Adjust subplot to ensure labels fit within square canvas
-    plt.subplots_adjust(left=0.15, right=0.85, top=0.82, bottom=0.15)
+    fig.subplots_adjust(left=0.15, right=0.85, top=0.82, bottom=0.15)
 
-    # Save to temp file with fixed bbox to maintain square aspect ratio
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-    plt.savefig(temp_file.name, dpi=150, bbox_inches=None)  # Keep square shape
-    plt.close(fig)
+    # Render to an in-memory PNG with fixed bbox to maintain square aspect ratio
+    buf = BytesIO()
+    # Keep square shape
+    fig.savefig(buf, format="png", dpi=_PNG_DPI, pil_kwargs=_PNG_SAVE_OPTIONS, bbox_inches=None)
+    buf.seek(0)
 
-    return temp_file.name
+    return buf
 
 
-def save_duty_day_grouped_bar_chart(duty_day_stats: List[List[str]]) -> str:
+def save_duty_day_grouped_bar_chart(duty_day_stats: List[List[str]]) -> BytesIO:
     """
     Create and save grouped bar chart for duty day statistics.
 
@@ -504,9 +525,10 @@ def save_duty_day_grouped_bar_chart(duty_day_stats: List[List[str]]) -> str:
                         Format: [["Metric", "All", "EDW", "Non-EDW"], ...]
 
     Returns:
-        Path to temp PNG file
+        In-memory PNG image
     """
-    fig, ax = plt.subplots(figsize=(7, 4.5))
+    fig = Figure(figsize=(7, 4.5))
+    ax = fig.subplots()
 
     # Extract metrics and values from the table (skip header row)
     metrics = []
@@ -574,17 +596,17 @@ def save_duty_day_grouped_bar_chart(duty_day_stats: List[List[str]]) -> str:
     add_labels(bars2)
     add_labels(bars3)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
-    # Save to temp file
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-    plt.savefig(temp_file.name, dpi=150, bbox_inches="tight")
-    plt.close(fig)
+    # Render to an in-memory PNG
+    buf = BytesIO()
+    fig.savefig(buf, format="png", dpi=_PNG_DPI, pil_kwargs=_PNG_SAVE_OPTIONS)
+    buf.seek(0)
 
-    return temp_file.name
+    return buf
 
 
-def save_duty_day_radar_chart(duty_day_stats: List[List[str]]) -> str:
+def save_duty_day_radar_chart(duty_day_stats: List[List[str]]) -> BytesIO:
     """
     Create and save radar/spider chart for duty day statistics.
 
@@ -593,9 +615,10 @@ def save_duty_day_radar_chart(duty_day_stats: List[List[str]]) -> str:
                         Format: [["Metric", "All", "EDW", "Non-EDW"], ...]
 
     Returns:
-        Path to temp PNG file
+        In-memory PNG image
     """
-    fig, ax = plt.subplots(figsize=(5, 5), subplot_kw=dict(projection="polar"))
+    fig = Figure(figsize=(5, 5))
+    ax = fig.subplots(subplot_kw=dict(projection="polar"))
 
     # Extract metrics and values
     metrics = []
@@ -669,11 +692,11 @@ def save_duty_day_radar_chart(duty_day_stats: List[List[str]]) -> str:
     ax.legend(loc="upper right", bbox_to_anchor=(1.2, 1.1), fontsize=9)
     ax.set_title("EDW vs Non-EDW Profile", fontsize=12, weight="bold", pad=20)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
-    # Save to temp file
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-    plt.savefig(temp_file.name, dpi=150, bbox_inches="tight")
-    plt.close(fig)
+    # Render to an in-memory PNG
+    buf = BytesIO()
+    fig.savefig(buf, format="png", dpi=_PNG_DPI, pil_kwargs=_PNG_SAVE_OPTIONS)
+    buf.seek(0)
 
-    return temp_file.name
+    return buf
@@ -21,7 +21,6 @@ from database import (
     save_bid_lines,
     save_bid_period,
 )
-from pdf_generation import ReportMetadata, create_bid_line_pdf_report
 from ui_components import (
     apply_dataframe_filters,
     create_bid_line_editor,
@@ -540,6 +539,10 @@ def _display_bid_line_results():
     with col2:
         # PDF Report (uses filtered data with edits)
         try:
+            # Imported here: ReportLab and Matplotlib dominate app start-up time
+            # and are only needed once a report is built
+            from pdf_generation import ReportMetadata, create_bid_line_pdf_report
+
             header = st.session_state.bidline_header_info
             title = f"{header['domicile']} {header['fleet_type']} – Bid {header['bid_period']}"
             subtitle = f"Bid Line Analysis Report • {header['bid_period_date_range']}"
@@ -1,5 +1,6 @@
 """EDW Pairing Analyzer page (Tab 1)."""
 
+import os
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -18,8 +19,7 @@ from database import (
     save_bid_period,
     save_pairings,
 )
-from edw import extract_pdf_header_info, run_edw_report
-from pdf_generation import create_edw_pdf_report
+from edw import extract_pdf_header_info, parse_pairings, run_edw_report
 from ui_components import (
     generate_edw_filename,
     handle_pdf_generation_error,
@@ -58,6 +58,29 @@ def _extract_edw_header_cached(file_bytes: bytes, filename: str) -> dict:
     return extract_pdf_header_info(pdf_path)
 
 
+@st.cache_data(show_spinner="Extracting pairings...")
+def _parse_pairings_cached(file_bytes: bytes, filename: str) -> list:
+    """
+    Extract the trip texts from an EDW PDF with caching.
+
+    Text extraction is the slowest part of the analysis and depends only on the
+    file, so it is cached separately: re-running the report for the same PDF
+    with a different domicile, aircraft or bid period skips it.
+
+    Args:
+        file_bytes: Raw PDF file bytes
+        filename: Original filename (for temp file creation)
+
+    Returns:
+        List of trip text strings
+    """
+    tmpdir = Path(tempfile.mkdtemp())
+    pdf_path = tmpdir / filename
+    pdf_path.write_bytes(file_bytes)
+
+    return parse_pairings(pdf_path)
+
+
 @st.cache_data(show_spinner="Running EDW analysis...")
 def _run_edw_report_cached(
     file_bytes: bytes,
@@ -98,9 +121,44 @@ def _run_edw_report_cached(
         aircraft=aircraft,
         bid_period=bid_period,
         progress_callback=None,
+        trips=_parse_pairings_cached(file_bytes, filename),
     )
 
 
+@st.cache_data(show_spinner="Generating PDF report...")
+def _create_edw_pdf_cached(pdf_data: dict, branding: dict) -> bytes:
+    """
+    Build the executive EDW PDF report with caching.
+
+    The download section is re-rendered on every widget interaction; caching on
+    the report data means the charts and PDF are only built once per distinct
+    report instead of on every rerun.
+
+    Args:
+        pdf_data: Report data dictionary for create_edw_pdf_report
+        branding: Branding dictionary with colors and header title
+
+    Returns:
+        PDF file bytes
+    """
+    # Imported here: ReportLab and Matplotlib dominate app start-up time and are
+    # only needed once a report is downloaded
+    from pdf_generation import create_edw_pdf_report
+
+    # Create temporary file for PDF
+    temp_pdf = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
+    temp_pdf.close()
+    try:
+        create_edw_pdf_report(pdf_data, temp_pdf.name, branding)
+
+        # Read the PDF bytes
+        with open(temp_pdf.name, "rb") as f:
+            return f.read()
+    finally:
+        # Clean up temp file
+        os.unlink(temp_pdf.name)
+
+
 def render_edw_analyzer():
     """Render the EDW Pairing Analyzer tab."""
 
@@ -755,8 +813,11 @@ def display_edw_results(result_data: Dict):
                     ],
                 ],
                 "trip_length_distribution": [
-                    {"duty_days": int(row["Duty Days"]), "trips": int(row["Trips"])}
-                    for _, row in result_data["res"]["duty_dist"].iterrows()
+                    {"duty_days": int(duty_days), "trips": int(trips)}
+                    for duty_days, trips in zip(
+                        result_data["res"]["duty_dist"]["Duty Days"],
+                        result_data["res"]["duty_dist"]["Trips"],
+                    )
                 ],
                 "notes": result_data.get("notes", ""),
                 "generated_by": "",
@@ -773,18 +834,8 @@ def display_edw_results(result_data: Dict):
                 "title_left": f"{dom} {ac} – Bid {bid} | Pairing Analysis Report",
             }
 
-            # Create temporary file for PDF
-            temp_pdf = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-            create_edw_pdf_report(pdf_data, temp_pdf.name, branding)
-
-            # Read the PDF bytes
-            with open(temp_pdf.name, "rb") as f:
-                pdf_bytes = f.read()
-
-            # Clean up temp file
-            import os
-
-            os.unlink(temp_pdf.name)
+            # Cached on the report data: reruns with unchanged results reuse the PDF
+            pdf_bytes = _create_edw_pdf_cached(pdf_data, branding)
 
             render_pdf_download(
                 pdf_bytes,